@@ -2,13 +2,22 @@
 
 import os
 import sys
+import argparse
+import multiprocessing
 
 import django
 from django.conf import settings
 from django.test.utils import get_runner
 
 
-def run_tests(*test_args):
+def parallel_type(value):
+    """Parse the value passed to the ``--parallel`` option."""
+    if value == 'auto':
+        return multiprocessing.cpu_count()
+    return int(value)
+
+
+def run_tests(*test_args, parallel=0):
     if not test_args:
         test_args = ['tests']
     else:
@@ -17,10 +26,15 @@ def run_tests(*test_args):
     os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.settings'
     django.setup()
     TestRunner = get_runner(settings)
-    test_runner = TestRunner()
+    test_runner = TestRunner(parallel=parallel)
     failures = test_runner.run_tests(test_args)
     sys.exit(bool(failures))
 
 
 if __name__ == '__main__':
-    run_tests(*sys.argv[1:])
+    parser = argparse.ArgumentParser()
+    parser.add_argument('module', nargs='?')
+    parser.add_argument('--parallel', nargs='?', const='auto', default=0,
+                        type=parallel_type)
+    args = parser.parse_args()
+    run_tests(*filter(None, [args.module]), parallel=args.parallel)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Builds the source and wheel distributions and uploads them to pypi.org.
+
+Usage::
+
+    python scripts/publish.py          # upload to pypi.org
+    python scripts/publish.py --test   # upload to test.pypi.org
+"""
+import os
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# "vimage/__init__.py" holds nothing but the version string, so importing it
+# is cheaper than scraping the file with a regex.
+from vimage import __version__ as version  # noqa: E402
+
+
+def publish(test=False):
+    try:
+        import twine
+        print(f'Twine version: {twine.__version__}')
+    except ImportError:
+        print('"twine" library is missing. Please run "pip install twine"')
+        sys.exit()
+    repo_url = '--repository-url https://test.pypi.org/legacy/' if test else ''
+    os.chdir(ROOT_DIR)
+    # upon new release, create new source distribution and a
+    # new wheel distribution
+    print(f'[Step 1/3] creating source and wheel distributions '
+          f'for version {version}{"." * 10}')
+    os.system('python setup.py sdist bdist_wheel')
+    print('[Step 1/3] DONE!')
+    # # upon creation of the above two files, upload to pypi.org only
+    # # the newest version. First the source distribution
+    print(f'[Step 2/3] uploading source distribution{"." * 10}')
+    os.system(f'twine upload {repo_url} dist/django-vimage-{version}.tar.gz')
+    print('[Step 2/3] DONE!')
+    # # and then the wheel one.
+    print(f'[Step 3/3] uploading wheel distribution to pypi.org{"." * 10}')
+    os.system(f'twine upload {repo_url} '
+              f'dist/django_vimage-{version}-py3-none-any.whl')
+    print('[Step 3/3] DONE!')
+    print("Everything's done, congratulations!")
+
+
+if __name__ == '__main__':
+    publish(test=sys.argv[-1] == '--test')
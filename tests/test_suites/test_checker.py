@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 from django.conf import settings
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, override_settings
 
 from vimage.core import exceptions
 from vimage.core.const import CONFIG_NAME, APP_NAME
@@ -10,7 +10,11 @@ from vimage.core.checker import configuration_check
 from .const import dotted_path
 
 
-class ConfigurationTestCase(TestCase):
+INVALID_CONFIG_TYPES = (int, float, complex, list, tuple,
+                        str, bytes, bytearray, set, frozenset)
+
+
+class ConfigurationTestCase(SimpleTestCase):
     @override_settings()
     def test_missing_config(self):
         del settings.VIMAGE
@@ -20,21 +24,6 @@ class ConfigurationTestCase(TestCase):
         with self.assertRaisesMessage(exceptions.MissingConfigError, error):
             configuration_check()
 
-    @override_settings()
-    def test_invalid_config_type(self):
-        invalid_config_types = [int, float, complex, list, tuple,
-                                str, bytes, bytearray, set, frozenset]
-        for invalid_type in invalid_config_types:
-            with self.subTest(invalid_type=invalid_type):
-                del settings.VIMAGE
-                settings.VIMAGE = invalid_type
-                error = f'"{CONFIG_NAME}" type is not a dictionary. ' \
-                        f'The value should be a non-empty dict!'
-                with self.assertRaisesMessage(
-                    exceptions.InvalidConfigValueError, error
-                ):
-                    configuration_check()
-
     def test_empty_config(self):
         with self.settings(VIMAGE={}):
             error = f'"{CONFIG_NAME}" configuration is an empty dict! ' \
@@ -42,8 +31,27 @@ class ConfigurationTestCase(TestCase):
             with self.assertRaisesMessage(exceptions.EmptyConfigError, error):
                 configuration_check()
 
-    def test_vimage_entry_is_valid_called(self):
+    def test_invalid_config_type(self):
+        error = f'"{CONFIG_NAME}" type is not a dictionary. ' \
+                f'The value should be a non-empty dict!'
+        for invalid_type in INVALID_CONFIG_TYPES:
+            with self.subTest(invalid_type=invalid_type), \
+                    self.settings(VIMAGE=invalid_type):
+                with self.assertRaisesMessage(
+                    exceptions.InvalidConfigValueError, error
+                ):
+                    configuration_check()
+
+    @patch(dotted_path('base', 'VimageEntry', 'is_valid'))
+    def test_vimage_entry_is_valid_called(self, m):
         with self.settings(VIMAGE={'my_app': {'SIZE': 100}}):
-            with patch(dotted_path('base', 'VimageEntry', 'is_valid')) as m:
+            configuration_check()
+            self.assertTrue(m.called)
+
+    def test_config_edited_in_place_rechecked(self):
+        config = {'myapp.models': {'SIZE': 100}}
+        with self.settings(VIMAGE=config):
+            configuration_check()
+            config['myapp.models'] = {'SIZE': -5}
+            with self.assertRaises(exceptions.InvalidValueError):
                 configuration_check()
-                self.assertTrue(m.called)
@@ -0,0 +1,9 @@
+from django.test import SimpleTestCase
+
+from vimage.apps import VimageConfig
+from vimage.core.const import APP_NAME
+
+
+class ConstTestCase(SimpleTestCase):
+    def test_app_name(self):
+        self.assertEqual(APP_NAME, VimageConfig.name)
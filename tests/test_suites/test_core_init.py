@@ -1,16 +1,16 @@
 from unittest.mock import patch
 
 from django.conf import settings
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, override_settings
 
 from vimage.core import add_validators
 from .const import dotted_path
 
 
-class CoreInitTestCase(TestCase):
+class CoreInitTestCase(SimpleTestCase):
     @override_settings()
-    def test_add_validators(self):
+    @patch(dotted_path('base', 'VimageConfig', 'add_validators'))
+    def test_add_validators(self, m):
         settings.VIMAGE = 'VIMAGE'
-        with patch(dotted_path('base', 'VimageConfig', 'add_validators')) as m:
-            add_validators()
-            self.assertTrue(m.called)
+        add_validators()
+        self.assertTrue(m.called)
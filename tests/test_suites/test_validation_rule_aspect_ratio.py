@@ -1,17 +1,26 @@
 from types import FunctionType
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.core.exceptions import ValidationError
 
+from vimage.core import validator_types
 from vimage.core.validator_types import ValidationRuleAspectRatio
 from vimage.core.exceptions import InvalidValueError
 
 from .test_validation_rule_base import ValidatorTestCase
-from .const import dotted_path
+from .const import validator_for
 
 
-class ValidationRuleAspectRatioTestCase(TestCase):
+RULE_TYPE_ERR = 'The value of the rule "ASPECT_RATIO", "{rule}", ' \
+                'should be either a float or dict.'
+RULE_POSITIVE_ERR = 'The value of the rule "ASPECT_RATIO", "{rule}", ' \
+                    'should be a positive float.'
+RULE_EMPTY_DICT_ERR = 'The value of the rule "ASPECT_RATIO", "{rule}", ' \
+                      'should be a non-empty dict.'
+
+
+class ValidationRuleAspectRatioTestCase(SimpleTestCase):
     def test_humanize_rule(self):
         vr = ValidationRuleAspectRatio('ASPECT_RATIO', 1.5)
         self.assertEqual(vr.humanize_rule(), 'equal to 1.5')
@@ -25,52 +34,34 @@ class ValidationRuleAspectRatioTestCase(TestCase):
             'greater than 1.5 and less than 2.1'
         )
 
-    def test_valid_dict_rule(self):
+    @patch.object(validator_types.ValidationRuleBase, 'validate_operators')
+    def test_valid_dict_rule(self, m):
         vr = ValidationRuleAspectRatio('ASPECT_RATIO', {'gt': 1.5, 'lt': 2.1})
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'validate_operators')) as m:
-            vr.valid_dict_rule()
-            args, kwargs = m.call_args
-            self.assertTrue(m.called)
-            self.assertEqual(args, ({'gt': 1.5, 'lt': 2.1}, float))
-            self.assertEqual(kwargs, {})
-
-    def test_is_valid(self):
-        # Rule value must be a float
-        vr = ValidationRuleAspectRatio('ASPECT_RATIO', '')
-        err = f'The value of the rule "ASPECT_RATIO", "", ' \
-              f'should be either a float or dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # positive int (invalid)
-        vr = ValidationRuleAspectRatio('ASPECT_RATIO', 1)
-        err = f'The value of the rule "ASPECT_RATIO", "1", ' \
-              f'should be either a float or dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # negative float (invalid)
-        vr = ValidationRuleAspectRatio('ASPECT_RATIO', -1.5)
-        err = f'The value of the rule "ASPECT_RATIO", "-1.5", ' \
-              f'should be a positive float.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # invalid value (empty dict)
-        vr = ValidationRuleAspectRatio('ASPECT_RATIO', {})
-        err = f'The value of the rule "ASPECT_RATIO", "{{}}", ' \
-              f'should be a non-empty dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
+        vr.valid_dict_rule()
+        args, kwargs = m.call_args
+        self.assertTrue(m.called)
+        self.assertEqual(args, ({'gt': 1.5, 'lt': 2.1}, float))
+        self.assertEqual(kwargs, {})
+
+    @patch.object(ValidationRuleAspectRatio, 'valid_dict_rule')
+    def test_is_valid(self, m):
+        invalid_rules = [
+            ('', RULE_TYPE_ERR),  # Rule value must be a float
+            (1, RULE_TYPE_ERR),  # positive int (invalid)
+            (-1.5, RULE_POSITIVE_ERR),  # negative float (invalid)
+            ({}, RULE_EMPTY_DICT_ERR),  # invalid value (empty dict)
+        ]
+        for rule, err in invalid_rules:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleAspectRatio('ASPECT_RATIO', rule)
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err.format(rule=rule))
 
         # valid value (correct dict)
         vr = ValidationRuleAspectRatio('ASPECT_RATIO', {'eq': 1.0})
-        m_path = dotted_path('validator_types', 'ValidationRuleAspectRatio',
-                             'valid_dict_rule')
-        with patch(m_path) as m:
-            vr.is_valid()
-            self.assertTrue(m.called)
+        vr.is_valid()
+        self.assertTrue(m.called)
 
         # valid values
         vr = ValidationRuleAspectRatio('ASPECT_RATIO', 1.0)
@@ -80,14 +71,10 @@ class ValidationRuleAspectRatioTestCase(TestCase):
 
 
 class ValidationRuleAspectRatioValidatorTestCase(ValidatorTestCase):
-    def test_generator_is_function(self):
+    def test_generator_properties(self):
         vr = ValidationRuleAspectRatio('a', 1.0)
         validator = vr.generate_validator()
         self.assertIsInstance(validator, FunctionType)
-
-    def test_generator_docstring(self):
-        vr = ValidationRuleAspectRatio('a', 1.0)
-        validator = vr.generate_validator()
         self.assertEqual(validator.__doc__, 'a: 1.0')
 
     def test_generate_validator__valid(self):
@@ -99,7 +86,7 @@ class ValidationRuleAspectRatioValidatorTestCase(ValidatorTestCase):
         ]
         for valid_rule in valid_rules:
             with self.subTest(valid_rule=valid_rule):
-                validator = valid_rule.generate_validator()
+                validator = validator_for(valid_rule)
                 self.assertIsNone(validator(self.img))
 
     def test_generate_validator__invalid(self):
@@ -112,7 +99,7 @@ class ValidationRuleAspectRatioValidatorTestCase(ValidatorTestCase):
         for invalid_rule in invalid_rules:
             with self.subTest(invalid_rule=invalid_rule):
                 with self.assertRaises(ValidationError):
-                    validator = invalid_rule.generate_validator()
+                    validator = validator_for(invalid_rule)
                     validator(self.img)
 
     def test_generate_validator_custom_error(self):
@@ -1,8 +1,9 @@
-import os
 import operator
+from functools import lru_cache
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
 from django.utils.safestring import SafeText
 
 from vimage.core import const
@@ -10,12 +11,26 @@ from vimage.core import validator_types
 from vimage.core.exceptions import InvalidValueError
 from tests.apps.myapp.models import MyModel
 
-from .const import IMAGES_PATH, dotted_path, image
+from .const import JPEG_500x498, make_jpeg
 
 
-class ValidationRuleBaseTestCase1(TestCase):
-    def setUp(self):
-        self.vr = validator_types.ValidationRuleBase('SIZE', 100)
+INVALID_KEY_ERR = 'Encountered invalid key, "a" inside "{\'a\': 1}"!'
+VALUE_TYPE_ERR = 'The value of the key "gte", inside "{\'gte\': \'\'}", ' \
+                 'should be "int". Now it\'s type is "str".'
+VALUE_POSITIVE_INT_ERR = 'The value of the key "gte", inside ' \
+                         '"{\'gte\': -1}", should be a positive integer. ' \
+                         'Now it\'s value is "-1".'
+VALUE_POSITIVE_TUPLE_ERR = 'The value of the key "gte", inside ' \
+                           '"{\'gte\': (1, -1)}", should consist of ' \
+                           'tuples with two positive integers, each. ' \
+                           'Now it\'s value is "(1, -1)".'
+
+
+class ValidationRuleBaseTestCase1(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vr = validator_types.ValidationRuleBase('SIZE', 100)
 
     def test_init(self):
         self.assertEqual(self.vr.name, 'SIZE')
@@ -23,6 +38,11 @@ class ValidationRuleBaseTestCase1(TestCase):
         self.assertEqual(self.vr.equal, operator.eq)
         self.assertEqual(self.vr.trans_name, const.trans_type[self.vr.name])
 
+    def test_slots(self):
+        for name, cls in validator_types.mapping.items():
+            with self.subTest(cls=cls):
+                self.assertFalse(hasattr(cls(name, ''), '__dict__'))
+
     def test_str(self):
         self.assertEqual(str(self.vr), 'SIZE: 100')
 
@@ -113,6 +133,12 @@ class ValidationRuleBaseTestCase1(TestCase):
         vr = validator_types.ValidationRuleBase('SIZE', {'gte': 1, 'lte': 2})
         self.assertIsNone(vr.validate_operators(vr.rule, int))
 
+        for pair in const.nonsense_operators():
+            with self.subTest(pair=pair):
+                with self.assertRaises(InvalidValueError):
+                    vr.nonsense_operators(pair | {'err'})
+        self.assertIsNone(vr.nonsense_operators(['gt', 'lt', 'ne', 'err']))
+
     def test_valid_dict_rule_str(self):
         # too many keys (invalid)
         vr = validator_types.ValidationRuleBase('FORMAT', {
@@ -125,8 +151,8 @@ class ValidationRuleBaseTestCase1(TestCase):
 
         # test that "only_err_key()" is called
         vr = validator_types.ValidationRuleBase('FORMAT', {'err': 'aa'})
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'only_err_key')) as m:
+        with patch.object(validator_types.ValidationRuleBase,
+                          'only_err_key') as m:
             vr.valid_dict_rule_str()
             self.assertTrue(m.called)
 
@@ -135,8 +161,8 @@ class ValidationRuleBaseTestCase1(TestCase):
             'ne': 'jpeg',
             'eq': 'png',
         })
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'nonsense_operators')) as m:
+        with patch.object(validator_types.ValidationRuleBase,
+                          'nonsense_operators') as m:
             vr.valid_dict_rule_str()
             self.assertTrue(m.called)
 
@@ -163,27 +189,27 @@ class ValidationRuleBaseTestCase1(TestCase):
                 self.assertIsNone(valid_key.valid_dict_rule_str())
 
 
-class ValidationRuleBaseTestCase2(TestCase):
+class ValidationRuleBaseTestCase2(SimpleTestCase):
     def test_validate_operators_keys(self):
         # test that "only_err_key()" is called
         vr = validator_types.ValidationRuleBase('FORMAT', {'err': 'aa'})
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'only_err_key')) as m:
+        with patch.object(validator_types.ValidationRuleBase,
+                          'only_err_key') as m:
             vr.validate_operators(vr.rule, int)
             self.assertTrue(m.called)
 
         # test that "nonsense_operators()" is called
         vr = validator_types.ValidationRuleBase('SIZE', {'gte': 1, 'eq': 2})
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'nonsense_operators')) as m:
+        with patch.object(validator_types.ValidationRuleBase,
+                          'nonsense_operators') as m:
             vr.validate_operators(vr.rule, int)
             self.assertTrue(m.called)
 
         # invalid rule keys (unknown)
         vr = validator_types.ValidationRuleBase('SIZE', {'a': 1})
-        err = f'Encountered invalid key, "a" inside "{{\'a\': 1}}"!'
-        with self.assertRaisesMessage(InvalidValueError, err):
+        with self.assertRaises(InvalidValueError) as cm:
             vr.validate_operators(vr.rule, int)
+        self.assertEqual(cm.exception.args[0], INVALID_KEY_ERR)
 
         valid_operators_int = [
             {'gt': 100, 'lte': 100},
@@ -206,27 +232,21 @@ class ValidationRuleBaseTestCase2(TestCase):
                 self.assertIsNone(vr.validate_operators(value, tuple))
 
     def test_validate_operators_dict_values(self):
-        # rule value is a str, it should be an int
-        vr = validator_types.ValidationRuleBase('SIZE', {'gte': ''})
-        err = f'The value of the key "gte", inside "{{\'gte\': \'\'}}", ' \
-              f'should be "int". Now it\'s type is "str".'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.validate_operators(vr.rule, int)
-
-        # rule value is a negative int, it should be positive
-        vr = validator_types.ValidationRuleBase('SIZE', {'gte': -1})
-        err = f'The value of the key "gte", inside "{{\'gte\': -1}}", ' \
-              f'should be a positive integer. Now it\'s value is "-1".'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.validate_operators(vr.rule, int)
-
-        # rule value's tuple contains negative element, must be all positive
-        vr = validator_types.ValidationRuleBase('SIZE', {'gte': (1, -1)})
-        err = f'The value of the key "gte", inside "{{\'gte\': (1, -1)}}", ' \
-              f'should consist of tuples with two positive ' \
-              f'integers, each. Now it\'s value is "(1, -1)".'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.validate_operators(vr.rule, tuple)
+        invalid_rules = [
+            # rule value is a str, it should be an int
+            ({'gte': ''}, int, VALUE_TYPE_ERR),
+            # rule value is a negative int, it should be positive
+            ({'gte': -1}, int, VALUE_POSITIVE_INT_ERR),
+            # rule value's tuple contains negative element, must be all
+            # positive
+            ({'gte': (1, -1)}, tuple, VALUE_POSITIVE_TUPLE_ERR),
+        ]
+        for rule, valid_value_type, err in invalid_rules:
+            with self.subTest(rule=rule):
+                vr = validator_types.ValidationRuleBase('SIZE', rule)
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.validate_operators(vr.rule, valid_value_type)
+                self.assertEqual(cm.exception.args[0], err)
 
         # valid rule values
         vr = validator_types.ValidationRuleBase('SIZE', {'gte': 1})
@@ -367,8 +387,18 @@ class ValidationRuleBaseTestCase3(ValidationRuleBaseTestCase1):
             ([operator.eq('jpeg', 'jpeg')], 'hello')
         )
 
+    def test_bind_operators(self):
+        self.assertEqual(
+            self.vr.bind_operators({'gte': 100, 'lte': 500}),
+            (((operator.ge, 100), (operator.le, 500)), '')
+        )
+        self.assertEqual(
+            self.vr.bind_operators({'ne': 'jpeg', 'err': 'hello'}),
+            (((operator.ne, 'jpeg'), ), 'hello')
+        )
+
 
-class ValidationRuleFactoryTestCase(TestCase):
+class ValidationRuleFactoryTestCase(SimpleTestCase):
     def test_validation_rule_factory_valid(self):
         self.assertIsInstance(
             validator_types.validation_rule_factory('SIZE', ''),
@@ -395,9 +425,40 @@ class ValidationRuleFactoryTestCase(TestCase):
             validator_types.validation_rule_factory(inv, '')
 
 
-class ValidatorTestCase(TestCase):
-    def setUp(self):
-        path_to_image = os.path.join(IMAGES_PATH, '500x498-100KB.jpeg')
-        img = image(name='test_image_size', path=path_to_image)
-        my_model = MyModel(heading='heading', img=img, number=1)
-        self.img = my_model.img
+@lru_cache(maxsize=None)
+def validator_image():
+    """
+    Returns the image shared by every validator test case of the run. It
+    must be a real image (not a mock) since the validators decode it with
+    Pillow. Sharing is safe because every validator rewinds the file before
+    reading it.
+    """
+    img = ContentFile(JPEG_500x498, name='test_image_size')
+    return MyModel(heading='heading', img=img, number=1).img
+
+
+class ValidatorTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.img = validator_image()
+
+
+class ImageInfoTestCase(SimpleTestCase):
+    def test_image_info(self):
+        img = ContentFile(JPEG_500x498, name='image_info')
+        img.seek(10)
+        self.assertEqual(validator_types.image_info(img), ((500, 498), 'jpeg'))
+        self.assertEqual(img.tell(), 10)
+
+    def test_image_info_not_stored(self):
+        # Nothing is left on the (possibly committed) file, so that a
+        # replaced content is always parsed again.
+        img = ContentFile(JPEG_500x498, name='image_info')
+        self.assertEqual(validator_types.image_info(img), ((500, 498), 'jpeg'))
+        self.assertFalse(hasattr(img, '_vimage_info'))
+        content = make_jpeg(60, 40)
+        img.file.seek(0)
+        img.file.truncate()
+        img.file.write(content)
+        self.assertEqual(validator_types.image_info(img), ((60, 40), 'jpeg'))
@@ -1,86 +1,75 @@
 from types import FunctionType
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.core.exceptions import ValidationError
 
 from vimage.core.validator_types import ValidationRuleDimensions
 from vimage.core.exceptions import InvalidValueError
 
 from .test_validation_rule_base import ValidatorTestCase
-from .const import dotted_path
+from .const import swap, validator_for
 
 
-class ValidationRuleDimensionsTestCase(TestCase):
+ERR_TYPE = 'should be either a tuple, a list or a dict.'
+ERR_TUPLE = 'should consist of two positive integers.'
+ERR_LIST = 'should consist of tuples with two positive integers, each.'
+ERR_EMPTY_DICT = 'should be a non-empty dict.'
+
+INVALID_TUPLE_RULES = ((), (10,), (-10, 10), (-10, -10), (10, 10, 10))
+INVALID_LIST_RULES = ([], [(10,)], [(10, -10)], [(10, 10), (-10, 10)])
+
+
+class ValidationRuleDimensionsTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._width_height_rules = [
+            ValidationRuleDimensions('DIMENSIONS', {'w': 1}),
+            ValidationRuleDimensions('DIMENSIONS', {'h': 1}),
+            ValidationRuleDimensions('DIMENSIONS', {'w': 1, 'h': 1}),
+        ]
+        cls._no_width_height_rules = [
+            ValidationRuleDimensions('DIMENSIONS', {}),
+            ValidationRuleDimensions('DIMENSIONS', {'gte': 100}),
+        ]
+
     def test_init(self):
         vr = ValidationRuleDimensions('DIMENSIONS', 100)
         self.assertEqual(vr.unit, 'px')
 
     def test_humanize_rule(self):
-        vr = ValidationRuleDimensions('DIMENSIONS', (400, 400))
-        self.assertEqual(vr.humanize_rule(), 'equal to 400 x 400px')
-
-        vr = ValidationRuleDimensions('DIMENSIONS', [(40, 40), (50, 50)])
-        self.assertEqual(
-            vr.humanize_rule(),
-            'equal to one of the following dimensions 40 x 40px or 50 x 50px'
-        )
-
-        vr = ValidationRuleDimensions('DIMENSIONS', [(4, 4), (5, 5), (6, 6)])
-        self.assertEqual(
-            vr.humanize_rule(),
-            'equal to one of the following dimensions 4 x 4px, 5 x 5px '
-            'or 6 x 6px'
+        cases = (
+            ((400, 400), 'equal to 400 x 400px'),
+            ([(40, 40), (50, 50)],
+             'equal to one of the following dimensions 40 x 40px or '
+             '50 x 50px'),
+            ([(4, 4), (5, 5), (6, 6)],
+             'equal to one of the following dimensions 4 x 4px, 5 x 5px '
+             'or 6 x 6px'),
         )
+        for rule, expected in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleDimensions('DIMENSIONS', rule)
+                self.assertEqual(vr.humanize_rule(), expected)
 
     def test_humanize_rule_dict(self):
-        vr = ValidationRuleDimensions('DIMENSIONS', {
-            'w': {
-                'gte': 1000,
-                'lte': 1500,
-            },
-            'h': {
-                'gt': 500,
-                'lt': 600,
-            }
-        })
-        self.assertEqual(
-            vr.humanize_rule(),
-            'Width greater than or equal to 1000px and less than or equal to '
-            '1500px. Height greater than 500px and less than 600px'
-        )
-
-        vr = ValidationRuleDimensions('DIMENSIONS', {
-            'w': {
-                'gte': 1000,
-                'lte': 1500,
-            },
-        })
-        self.assertEqual(
-            vr.humanize_rule(),
-            'Width greater than or equal to 1000px and less than or equal to '
-            '1500px'
-        )
-
-        vr = ValidationRuleDimensions('DIMENSIONS', {
-            'h': {
-                'gt': 500,
-                'lt': 600,
-            },
-        })
-        self.assertEqual(
-            vr.humanize_rule(),
-            'Height greater than 500px and less than 600px'
-        )
-
-        vr = ValidationRuleDimensions('DIMENSIONS', {
-            'gt': (500, 500),
-            'lt': (600, 600),
-        })
-        self.assertEqual(
-            vr.humanize_rule(),
-            'greater than 500 x 500px and less than 600 x 600px'
+        cases = (
+            ({'w': {'gte': 1000, 'lte': 1500}, 'h': {'gt': 500, 'lt': 600}},
+             'Width greater than or equal to 1000px and less than or equal '
+             'to 1500px. Height greater than 500px and less than 600px'),
+            ({'w': {'gte': 1000, 'lte': 1500}},
+             'Width greater than or equal to 1000px and less than or equal '
+             'to 1500px'),
+            ({'h': {'gt': 500, 'lt': 600}},
+             'Height greater than 500px and less than 600px'),
+            ({'gt': (500, 500), 'lt': (600, 600)},
+             'greater than 500 x 500px and less than 600 x 600px'),
         )
+        for rule, expected in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleDimensions('DIMENSIONS', rule)
+                self.assertEqual(vr.humanize_rule(), expected)
 
     def test_prettify_list(self):
         vr = ValidationRuleDimensions('DIMENSIONS', [(3, 3), (4, 4)])
@@ -100,26 +89,17 @@ class ValidationRuleDimensionsTestCase(TestCase):
         with self.assertRaises(AttributeError):
             vr.has_width_height_keys()
 
-        width_height_rules = [
-            ValidationRuleDimensions('DIMENSIONS', {'w': 1}),
-            ValidationRuleDimensions('DIMENSIONS', {'h': 1}),
-            ValidationRuleDimensions('DIMENSIONS', {'w': 1, 'h': 1}),
-        ]
-        for rule in width_height_rules:
-            with self.subTest(rule=rule):
-                self.assertTrue(rule.has_width_height_keys())
+        for rule in self._width_height_rules:
+            self.assertTrue(rule.has_width_height_keys(), rule.rule)
 
-        no_width_height_rules = [
-            ValidationRuleDimensions('DIMENSIONS', {}),
-            ValidationRuleDimensions('DIMENSIONS', {'gte': 100}),
-        ]
-        for rule in no_width_height_rules:
-            with self.subTest(rule=rule):
-                self.assertFalse(rule.has_width_height_keys())
+        for rule in self._no_width_height_rules:
+            self.assertFalse(rule.has_width_height_keys(), rule.rule)
 
-    @patch(dotted_path('validator_types', 'ValidationRuleDimensions',
-                       'validate_operators'))
-    def test_valid_dict_rule_width_height(self, patch_method):
+    def test_valid_dict_rule_width_height(self):
+        patch_method = MagicMock()
+        self.addCleanup(
+            swap(ValidationRuleDimensions, 'validate_operators', patch_method)
+        )
         vr = ValidationRuleDimensions('DIMENSIONS', {'w': {}})
         vr.valid_dict_rule()
         args, kwargs = patch_method.call_args
@@ -127,9 +107,11 @@ class ValidationRuleDimensionsTestCase(TestCase):
         self.assertEqual(args, ({}, int))
         self.assertEqual(kwargs, {})
 
-    @patch(dotted_path('validator_types', 'ValidationRuleDimensions',
-                       'validate_operators'))
-    def test_valid_dict_rule_wo_width_height(self, patch_method):
+    def test_valid_dict_rule_wo_width_height(self):
+        patch_method = MagicMock()
+        self.addCleanup(
+            swap(ValidationRuleDimensions, 'validate_operators', patch_method)
+        )
         vr = ValidationRuleDimensions('DIMENSIONS', {})
         vr.valid_dict_rule()
         args, kwargs = patch_method.call_args
@@ -142,78 +124,151 @@ class ValidationRuleDimensionsTestCase(TestCase):
         "rule" should be either a tuple, a list or a dict filled with proper
         key-value validation rules.
         """
-        vr = ValidationRuleDimensions('DIMENSIONS', '')
-        err = f'The value of the rule "DIMENSIONS", "", ' \
-              f'should be either a tuple, a list or a dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        vr = ValidationRuleDimensions('DIMENSIONS', 12)
-        err = f'The value of the rule "DIMENSIONS", "12", ' \
-              f'should be either a tuple, a list or a dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-    def test_is_valid__dimensions_rule_tuple(self):
-        invalid_vrs = [
-            ValidationRuleDimensions('DIMENSIONS', ()),
-            ValidationRuleDimensions('DIMENSIONS', (10,)),
-            ValidationRuleDimensions('DIMENSIONS', (-10, 10)),
-            ValidationRuleDimensions('DIMENSIONS', (-10, -10)),
-            ValidationRuleDimensions('DIMENSIONS', (10, 10, 10)),
-        ]
-        for vr in invalid_vrs:
-            with self.subTest(vr=vr):
-                err = f'The value of the rule "DIMENSIONS", "{vr.rule}", ' \
-                      f'should consist of two positive integers.'
-                with self.assertRaisesMessage(InvalidValueError, err):
+        for rule in ('', 12):
+            with self.subTest(rule=rule):
+                vr = ValidationRuleDimensions('DIMENSIONS', rule)
+                err = f'The value of the rule "DIMENSIONS", "{rule}", ' \
+                      + ERR_TYPE
+                with self.assertRaises(InvalidValueError) as cm:
                     vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err)
 
+    def test_is_valid__dimensions_rule_tuple(self):
         vr = ValidationRuleDimensions('DIMENSIONS', (10, 10))
         self.assertIsNone(vr.is_valid())
 
     def test_is_valid__dimensions_rule_list(self):
-        invalid_vrs = [
-            ValidationRuleDimensions('DIMENSIONS', []),
-            ValidationRuleDimensions('DIMENSIONS', [(10,)]),
-            ValidationRuleDimensions('DIMENSIONS', [(10, -10)]),
-            ValidationRuleDimensions('DIMENSIONS', [(10, 10), (-10, 10)]),
-        ]
-        for vr in invalid_vrs:
-            with self.subTest(vr=vr):
-                err = f'The value of the rule "DIMENSIONS", "{vr.rule}", ' \
-                      f'should consist of tuples with two positive ' \
-                      f'integers, each.'
-                with self.assertRaisesMessage(InvalidValueError, err):
-                    vr.is_valid()
-
         vr = ValidationRuleDimensions('DIMENSIONS', [(10, 10), (5, 5)])
         self.assertIsNone(vr.is_valid())
 
+    def test_is_valid__dimensions_rule_tuple_list_invalid(self):
+        cases = [(rule, ERR_TUPLE) for rule in INVALID_TUPLE_RULES] + \
+                [(rule, ERR_LIST) for rule in INVALID_LIST_RULES]
+        for rule, err_suffix in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleDimensions('DIMENSIONS', rule)
+                err = f'The value of the rule "DIMENSIONS", "{rule}", ' \
+                      + err_suffix
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err)
+
     def test_is_valid__dimensions_rule_dict(self):
+        called = []
+        self.addCleanup(swap(ValidationRuleDimensions, 'valid_dict_rule',
+                             lambda self: called.append(self)))
         vr = ValidationRuleDimensions('DIMENSIONS', {})
-        err = f'The value of the rule "DIMENSIONS", "{{}}", ' \
-              f'should be a non-empty dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
+        err = 'The value of the rule "DIMENSIONS", "{}", ' + ERR_EMPTY_DICT
+        with self.assertRaises(InvalidValueError) as cm:
             vr.is_valid()
+        self.assertEqual(cm.exception.args[0], err)
 
-        with patch(dotted_path('validator_types', 'ValidationRuleDimensions',
-                               'valid_dict_rule')) as m:
-            vr = ValidationRuleDimensions('DIMENSIONS', {'gte': 100})
-            vr.is_valid()
-            # if dict is non-empty check that "valid_dict_rule" is called.
-            self.assertTrue(m.called)
+        vr = ValidationRuleDimensions('DIMENSIONS', {'gte': 100})
+        vr.is_valid()
+        # if dict is non-empty check that "valid_dict_rule" is called.
+        self.assertEqual(called, [vr])
 
 
 class ValidationRuleDimensionsValidatorTestCase(ValidatorTestCase):
-    def test_generator_is_function(self):
-        vr = ValidationRuleDimensions('a', 1)
-        validator = vr.generate_validator()
-        self.assertIsInstance(validator, FunctionType)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dict_valid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'gte': (500, 498),
+                    'lte': (500, 498),
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {'lt': (600, 600)}),
+                ValidationRuleDimensions('DIMENSIONS', {'lte': (500, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {'gte': (500, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'gte': (500, 498),
+                    'lte': (500, 498),
+                    'ne': (100, 100),
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'gte': (500, 498),
+                    'lte': (500, 498),
+                    'ne': (100, 100),
+                    'err': 'dimensions error message',
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {'ne': (100, 100)}),
+                ValidationRuleDimensions('DIMENSIONS', {'eq': (500, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'w': {
+                        'gt': 100,
+                    },
+                    'h': {
+                        'eq': 498,
+                    }
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'w': {
+                        'eq': 500,
+                    },
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'h': {
+                        'eq': 498,
+                        'err': 'width error message',
+                    }
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'w': {
+                        'gt': 100,
+                        'err': 'width error message',
+                    },
+                    'h': {
+                        'eq': 498,
+                        'err': 'height error message',
+                    }
+                }),
+            ]
+        ]
+        cls.dict_invalid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleDimensions('DIMENSIONS', {'gte': (150, 1000)}),
+                ValidationRuleDimensions('DIMENSIONS', {'lt': (500, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {'lte': (300, 400)}),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'gte': (150, 700),
+                    'lte': (100, 100),
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'gte': (600, 100),
+                    'lt': (1000, 1000),
+                    'ne': (450, 450),
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {'ne': (500, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {'eq': (50, 498)}),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'w': {
+                        'lt': 100,
+                    },
+                    'h': {
+                        'eq': 498,
+                    }
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'h': {
+                        'ne': 498,
+                    }
+                }),
+                ValidationRuleDimensions('DIMENSIONS', {
+                    'w': {
+                        'lte': 499,
+                    },
+                }),
+            ]
+        ]
 
-    def test_generator_docstring(self):
+    def test_generator_properties(self):
         vr = ValidationRuleDimensions('a', 1)
         validator = vr.generate_validator()
+        self.assertIsInstance(validator, FunctionType)
         self.assertEqual(validator.__doc__, 'a: 1')
 
     def test_generate_validator_tuple_valid(self):
@@ -238,101 +293,21 @@ class ValidationRuleDimensionsValidatorTestCase(ValidatorTestCase):
         with self.assertRaises(ValidationError):
             validator(self.img)
 
+    def test_generate_validator_list_unhashable(self):
+        # A rule not validated yet must not break the generation
+        vr = ValidationRuleDimensions('DIMENSIONS', [[500, 498], [5, 5]])
+        validator = vr.generate_validator()
+        with self.assertRaises(ValidationError):
+            validator(self.img)
+
     def test_generate_validator_dict_valid(self):
-        valid_rules = [
-            ValidationRuleDimensions('DIMENSIONS', {
-                'gte': (500, 498),
-                'lte': (500, 498),
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {'lt': (600, 600)}),
-            ValidationRuleDimensions('DIMENSIONS', {'lte': (500, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {'gte': (500, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'gte': (500, 498),
-                'lte': (500, 498),
-                'ne': (100, 100),
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'gte': (500, 498),
-                'lte': (500, 498),
-                'ne': (100, 100),
-                'err': 'dimensions error message',
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {'ne': (100, 100)}),
-            ValidationRuleDimensions('DIMENSIONS', {'eq': (500, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'w': {
-                    'gt': 100,
-                },
-                'h': {
-                    'eq': 498,
-                }
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'w': {
-                    'eq': 500,
-                },
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'h': {
-                    'eq': 498,
-                    'err': 'width error message',
-                }
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'w': {
-                    'gt': 100,
-                    'err': 'width error message',
-                },
-                'h': {
-                    'eq': 498,
-                    'err': 'height error message',
-                }
-            }),
-        ]
-        for vr in valid_rules:
+        for vr, validator in self.dict_valid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 self.assertIsNone(validator(self.img))
 
     def test_generate_validator_dict_invalid(self):
-        invalid_rules = [
-            ValidationRuleDimensions('DIMENSIONS', {'gte': (150, 1000)}),
-            ValidationRuleDimensions('DIMENSIONS', {'lt': (500, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {'lte': (300, 400)}),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'gte': (150, 700),
-                'lte': (100, 100),
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'gte': (600, 100),
-                'lt': (1000, 1000),
-                'ne': (450, 450),
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {'ne': (500, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {'eq': (50, 498)}),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'w': {
-                    'lt': 100,
-                },
-                'h': {
-                    'eq': 498,
-                }
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'h': {
-                    'ne': 498,
-                }
-            }),
-            ValidationRuleDimensions('DIMENSIONS', {
-                'w': {
-                    'lte': 499,
-                },
-            }),
-        ]
-        for vr in invalid_rules:
+        for vr, validator in self.dict_invalid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 with self.assertRaises(ValidationError):
                     validator(self.img)
 
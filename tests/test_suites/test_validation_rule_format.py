@@ -1,41 +1,41 @@
 from types import FunctionType
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.core.exceptions import ValidationError
 
-from vimage.core.validator_types import ValidationRuleFormat
+from vimage.core.validator_types import (
+    ValidationRuleBase, ValidationRuleFormat
+)
 from vimage.core.exceptions import InvalidValueError
 
 from .test_validation_rule_base import ValidatorTestCase
-from .const import dotted_path
+from .const import swap, validator_for
 
 
-class ValidationRuleFormatTestCase(TestCase):
-    def test_humanize_rule(self):
-        vr = ValidationRuleFormat('FORMAT', 'jpeg')
-        self.assertEqual(vr.humanize_rule(), 'equal to JPEG')
-
-        vr = ValidationRuleFormat('FORMAT', ['jpeg'])
-        self.assertEqual(vr.humanize_rule(), 'equal to JPEG')
-
-        vr = ValidationRuleFormat('FORMAT', ['jpeg', 'webp'])
-        self.assertEqual(
-            vr.humanize_rule(),
-            'equal to one of the following formats JPEG or WEBP'
-        )
-
-        vr = ValidationRuleFormat('FORMAT', {'ne': 'gif'})
-        self.assertEqual(vr.humanize_rule(), 'not equal to GIF')
+ERR_TYPE = 'should be either a str, list or dict.'
+ERR_STR = 'should be one of the valid formats: "jpeg, png, gif, bmp, webp".'
+ERR_LIST = 'should be one or more of the valid image formats: ' \
+           '"jpeg, png, gif, bmp, webp".'
+ERR_EMPTY_DICT = 'should be a non-empty dict.'
 
-        vr = ValidationRuleFormat('FORMAT', {'eq': 'gif'})
-        self.assertEqual(vr.humanize_rule(), 'equal to GIF')
 
-        vr = ValidationRuleFormat('FORMAT', {'ne': ['gif', 'png']})
-        self.assertEqual(
-            vr.humanize_rule(),
-            'not equal to the following formats GIF and PNG'
+class ValidationRuleFormatTestCase(SimpleTestCase):
+    def test_humanize_rule(self):
+        cases = (
+            ('jpeg', 'equal to JPEG'),
+            (['jpeg'], 'equal to JPEG'),
+            (['jpeg', 'webp'],
+             'equal to one of the following formats JPEG or WEBP'),
+            ({'ne': 'gif'}, 'not equal to GIF'),
+            ({'eq': 'gif'}, 'equal to GIF'),
+            ({'ne': ['gif', 'png']},
+             'not equal to the following formats GIF and PNG'),
         )
+        for rule, expected in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleFormat('FORMAT', rule)
+                self.assertEqual(vr.humanize_rule(), expected)
 
     def test_prettify_list(self):
         vr = ValidationRuleFormat('FORMAT', ['jpeg', 'png'])
@@ -78,10 +78,13 @@ class ValidationRuleFormatTestCase(TestCase):
 
         # dict with invalid key. Invalid.
         vr = ValidationRuleFormat('FORMAT', {'eq': 'jpeg'})
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'valid_dict_rule_str')) as m:
+        m = MagicMock()
+        restore = swap(ValidationRuleBase, 'valid_dict_rule_str', m)
+        try:
             vr.valid_dict_rule()
             self.assertTrue(m.called)
+        finally:
+            restore()
 
         # Dict with valid key but wrong value type
         vr = ValidationRuleFormat('FORMAT', {'ne': 1})
@@ -121,37 +124,25 @@ class ValidationRuleFormatTestCase(TestCase):
         self.assertIsNone(vr.valid_dict_rule())
 
     def test_is_valid__false(self):
-        # Rule not one of [str, list, dict]
-        vr = ValidationRuleFormat('FORMAT', 123)
-        err = f'The value of the rule "FORMAT", "123", ' \
-              f'should be either a str, list or dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # Rule is not an allowable string
-        vr = ValidationRuleFormat('FORMAT', 'hello')
-        err = f'The value of the rule "FORMAT", "hello", ' \
-              f'should be one of the valid formats: ' \
-              f'"jpeg, png, gif, bmp, webp".'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # Rule is not an allowable list
-        vr = ValidationRuleFormat('FORMAT', ['hello'])
-        err = f'The value of the rule "FORMAT", "[\'hello\']", ' \
-              f'should be one or more of the valid image formats: ' \
-              f'"jpeg, png, gif, bmp, webp".'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # Rule is an empty dict. Invalid
-        vr = ValidationRuleFormat('FORMAT', {})
-        err = f'The value of the rule "FORMAT", "{{}}", ' \
-              f'should be a non-empty dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
+        cases = (
+            (123, ERR_TYPE),  # not one of [str, list, dict]
+            ('hello', ERR_STR),  # not an allowable string
+            (['hello'], ERR_LIST),  # not an allowable list
+            ({}, ERR_EMPTY_DICT),  # empty dict
+        )
+        for rule, err_suffix in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleFormat('FORMAT', rule)
+                err = f'The value of the rule "FORMAT", "{rule}", ' \
+                      + err_suffix
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err)
 
     def test_is_valid__true(self):
+        called = []
+        self.addCleanup(swap(ValidationRuleFormat, 'valid_dict_rule',
+                             lambda self: called.append(self)))
         vr = ValidationRuleFormat('FORMAT', 'jpeg')
         self.assertIsNone(vr.is_valid())
 
@@ -159,21 +150,42 @@ class ValidationRuleFormatTestCase(TestCase):
         self.assertIsNone(vr.is_valid())
 
         vr = ValidationRuleFormat('FORMAT', {'ne': 'bmp'})
-        with patch(dotted_path('validator_types', 'ValidationRuleFormat',
-                               'valid_dict_rule')) as m:
-            self.assertIsNone(vr.is_valid())
-            self.assertTrue(m.called)
+        self.assertIsNone(vr.is_valid())
+        self.assertEqual(called, [vr])
 
 
 class ValidationRuleFormatValidatorTestCase(ValidatorTestCase):
-    def test_generator_is_function(self):
-        vr = ValidationRuleFormat('a', 1)
-        validator = vr.generate_validator()
-        self.assertIsInstance(validator, FunctionType)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dict_valid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleFormat('FORMAT', {'ne': 'webp'}),
+                ValidationRuleFormat('FORMAT', {'eq': 'JPEG'}),
+                ValidationRuleFormat('FORMAT', {'eq': ['jpeg']}),
+                ValidationRuleFormat('FORMAT', {'ne': ['bmp', 'gif']}),
+                ValidationRuleFormat('FORMAT', {
+                    'ne': ['bmp', 'gif'],
+                    'err': 'invalid format',
+                }),
+            ]
+        ]
+        cls.dict_invalid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleFormat('FORMAT', {'ne': 'jpeg'}),
+                ValidationRuleFormat('FORMAT', {'ne': ['webp', 'jpeg']}),
+                ValidationRuleFormat('FORMAT', {'ne': ['webp', 'JPEG']}),
+                ValidationRuleFormat('FORMAT', {'eq': 'png'}),
+                ValidationRuleFormat('FORMAT', {'eq': ['jpeg', 'png']}),
+            ]
+        ]
 
-    def test_generator_docstring(self):
+    def test_generator_properties(self):
         vr = ValidationRuleFormat('a', 1)
         validator = vr.generate_validator()
+        self.assertIsInstance(validator, FunctionType)
         self.assertEqual(validator.__doc__, 'a: 1')
 
     def test_generate_validator_str_valid(self):
@@ -192,6 +204,10 @@ class ValidationRuleFormatValidatorTestCase(ValidatorTestCase):
         validator = vr.generate_validator()
         self.assertIsNone(validator(self.img))
 
+        vr = ValidationRuleFormat('FORMAT', ['BMP', 'JPEG'])
+        validator = vr.generate_validator()
+        self.assertIsNone(validator(self.img))
+
     def test_generate_validator_list_invalid(self):
         vr = ValidationRuleFormat('FORMAT', ['bmp', 'gif'])
         validator = vr.generate_validator()
@@ -199,27 +215,13 @@ class ValidationRuleFormatValidatorTestCase(ValidatorTestCase):
             validator(self.img)
 
     def test_generate_validator_dict_valid(self):
-        valid_rules = [
-            ValidationRuleFormat('FORMAT', {'ne': 'webp'}),
-            ValidationRuleFormat('FORMAT', {'ne': ['bmp', 'gif']}),
-            ValidationRuleFormat('FORMAT', {
-                'ne': ['bmp', 'gif'],
-                'err': 'invalid format',
-            }),
-        ]
-        for vr in valid_rules:
+        for vr, validator in self.dict_valid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 self.assertIsNone(validator(self.img))
 
     def test_generate_validator_dict_invalid(self):
-        invalid_rules = [
-            ValidationRuleFormat('FORMAT', {'ne': 'jpeg'}),
-            ValidationRuleFormat('FORMAT', {'ne': ['webp', 'jpeg']}),
-        ]
-        for vr in invalid_rules:
+        for vr, validator in self.dict_invalid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 with self.assertRaises(ValidationError):
                     validator(self.img)
 
@@ -1,39 +1,67 @@
 from types import FunctionType
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
+from django.utils import translation
 from django.core.exceptions import ValidationError
 
-from vimage.core.validator_types import ValidationRuleSize
+from vimage.core.validator_types import (
+    ValidationRuleBase, ValidationRuleSize
+)
 from vimage.core.exceptions import InvalidValueError
 
 from .test_validation_rule_base import ValidatorTestCase
-from .const import dotted_path
+from .const import swap, validator_for
 
 
-class ValidationRuleSizeTestCase(TestCase):
+ERR_TYPE = 'should be either an int or a dict.'
+ERR_POSITIVE = 'should be a positive integer.'
+ERR_EMPTY_DICT = 'should be a non-empty dict.'
+
+
+class ValidationRuleSizeTestCase(SimpleTestCase):
     def test_init(self):
         vr = ValidationRuleSize('SIZE', 100)
         self.assertEqual(vr.unit, 'KB')
 
     def test_humanize_rule(self):
+        m = MagicMock(wraps=ValidationRuleBase.format_humanized_rules)
+        self.addCleanup(swap(ValidationRuleBase, 'format_humanized_rules', m))
+        ValidationRuleSize.humanize_rule.cache_clear()
         vr = ValidationRuleSize('SIZE', 100)
         self.assertEqual(vr.humanize_rule(), 'equal to 100KB')
 
-        with patch(dotted_path('validator_types', 'ValidationRuleBase',
-                               'format_humanized_rules')) as m:
-            vr = ValidationRuleSize('SIZE', {'ne': 100})
-            vr.humanize_rule()
-            self.assertTrue(m.is_called)
+        vr = ValidationRuleSize('SIZE', {'ne': 100})
+        vr.humanize_rule()
+        self.assertTrue(m.called)
+
+    def test_humanize_rule_cached_per_language(self):
+        vr = ValidationRuleSize('SIZE', {'gt': 10, 'lt': 20})
+        self.assertIs(vr.humanize_rule(), vr.humanize_rule())
+        self.assertIs(
+            vr.humanize_rule(),
+            ValidationRuleSize('SIZE', {'gt': 10, 'lt': 20}).humanize_rule()
+        )
+        with translation.override('el'):
+            self.assertNotEqual(
+                vr.humanize_rule(),
+                'greater than 10KB and less than 20KB'
+            )
+        self.assertEqual(
+            vr.humanize_rule(),
+            'greater than 10KB and less than 20KB'
+        )
 
     def test_prettify_value(self):
         vr = ValidationRuleSize('SIZE', 100)
         self.assertEqual(vr.prettify_value(100), '100KB')
         self.assertEqual(vr.prettify_value('Hello'), 'HelloKB')
 
-    @patch(dotted_path('validator_types', 'ValidationRuleSize',
-                       'validate_operators'))
-    def test_valid_dict_rule(self, patch_method):
+    def test_valid_dict_rule(self):
+        patch_method = MagicMock()
+        self.addCleanup(
+            swap(ValidationRuleSize, 'validate_operators', patch_method)
+        )
         vr = ValidationRuleSize('SIZE', 100)
         vr.valid_dict_rule()
         self.assertTrue(patch_method.called)
@@ -43,38 +71,26 @@ class ValidationRuleSizeTestCase(TestCase):
         "rule" should be either a positive int or a dict filled with proper
         key-value validation rules.
         """
-        vr = ValidationRuleSize('SIZE', '')
-        err = f'The value of the rule "SIZE", "", ' \
-              f'should be either an int or a dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        vr = ValidationRuleSize('SIZE', [])
-        err = f'The value of the rule "SIZE", "[]", ' \
-              f'should be either an int or a dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        vr = ValidationRuleSize('SIZE', ())
-        err = f'The value of the rule "SIZE", "()", ' \
-              f'should be either an int or a dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
+        for rule in ('', [], ()):
+            with self.subTest(rule=rule):
+                vr = ValidationRuleSize('SIZE', rule)
+                err = f'The value of the rule "SIZE", "{rule}", ' + ERR_TYPE
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err)
 
     def test_is_valid__size_rule_value(self):
-        # invalid value (negative int)
-        vr = ValidationRuleSize('SIZE', -1)
-        err = f'The value of the rule "SIZE", "-1", ' \
-              f'should be a positive integer.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
-
-        # invalid value (empty dict)
-        vr = ValidationRuleSize('SIZE', {})
-        err = f'The value of the rule "SIZE", "{{}}", ' \
-              f'should be a non-empty dict.'
-        with self.assertRaisesMessage(InvalidValueError, err):
-            vr.is_valid()
+        cases = (
+            (-1, ERR_POSITIVE),  # negative int
+            ({}, ERR_EMPTY_DICT),  # empty dict
+        )
+        for rule, err_suffix in cases:
+            with self.subTest(rule=rule):
+                vr = ValidationRuleSize('SIZE', rule)
+                err = f'The value of the rule "SIZE", "{rule}", ' + err_suffix
+                with self.assertRaises(InvalidValueError) as cm:
+                    vr.is_valid()
+                self.assertEqual(cm.exception.args[0], err)
 
         # valid value (positive int)
         vr = ValidationRuleSize('SIZE', 1)
@@ -82,25 +98,59 @@ class ValidationRuleSizeTestCase(TestCase):
 
         # valid value (correct dict)
         vr = ValidationRuleSize('SIZE', {'gte': 100})
-        m_path = dotted_path('validator_types', 'ValidationRuleSize',
-                             'valid_dict_rule')
-        with patch(m_path) as m:
+        called = []
+        restore = swap(ValidationRuleSize, 'valid_dict_rule',
+                       lambda self: called.append(self))
+        try:
             vr.is_valid()
-            self.assertTrue(m.called)
+            self.assertEqual(called, [vr])
+        finally:
+            restore()
 
         # valid dict
         self.assertIsNone(vr.is_valid())
 
 
 class ValidationRuleSizeValidatorTestCase(ValidatorTestCase):
-    def test_generator_is_function(self):
-        vr = ValidationRuleSize('a', 1)
-        validator = vr.generate_validator()
-        self.assertIsInstance(validator, FunctionType)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.int_invalid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleSize('SIZE', 50),
+                ValidationRuleSize('SIZE', -1),
+            ]
+        ]
+        cls.dict_valid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleSize('SIZE', {'gte': 50}),
+                ValidationRuleSize('SIZE', {'lt': 200}),
+                ValidationRuleSize('SIZE', {'lte': 200}),
+                ValidationRuleSize('SIZE', {'gte': 50, 'lt': 200}),
+                ValidationRuleSize('SIZE', {'gte': 50, 'lt': 200, 'ne': 300}),
+                ValidationRuleSize('SIZE', {'ne': 300}),
+                ValidationRuleSize('SIZE', {'eq': 100}),
+            ]
+        ]
+        cls.dict_invalid_validators = [
+            (vr, validator_for(vr))
+            for vr in [
+                ValidationRuleSize('SIZE', {'gte': 150}),
+                ValidationRuleSize('SIZE', {'lt': 100}),
+                ValidationRuleSize('SIZE', {'lte': 99}),
+                ValidationRuleSize('SIZE', {'gte': 150, 'lte': 100}),
+                ValidationRuleSize('SIZE', {'gte': 99, 'lt': 100, 'ne': 300}),
+                ValidationRuleSize('SIZE', {'ne': 100}),
+                ValidationRuleSize('SIZE', {'eq': 200}),
+            ]
+        ]
 
-    def test_generator_docstring(self):
+    def test_generator_properties(self):
         vr = ValidationRuleSize('a', 1)
         validator = vr.generate_validator()
+        self.assertIsInstance(validator, FunctionType)
         self.assertEqual(validator.__doc__, 'a: 1')
 
     def test_generate_validator_int_valid(self):
@@ -110,44 +160,19 @@ class ValidationRuleSizeValidatorTestCase(ValidatorTestCase):
         self.assertIsNone(validator(self.img))
 
     def test_generate_validator_int_invalid(self):
-        invalid_rules = [
-            ValidationRuleSize('SIZE', 50),
-            ValidationRuleSize('SIZE', -1)
-        ]
-        for vr in invalid_rules:
+        for vr, validator in self.int_invalid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 with self.assertRaises(ValidationError):
                     validator(self.img)
 
     def test_generate_validator_dict_valid(self):
-        valid_rules = [
-            ValidationRuleSize('SIZE', {'gte': 50}),
-            ValidationRuleSize('SIZE', {'lt': 200}),
-            ValidationRuleSize('SIZE', {'lte': 200}),
-            ValidationRuleSize('SIZE', {'gte': 50, 'lt': 200}),
-            ValidationRuleSize('SIZE', {'gte': 50, 'lt': 200, 'ne': 300}),
-            ValidationRuleSize('SIZE', {'ne': 300}),
-            ValidationRuleSize('SIZE', {'eq': 100}),
-        ]
-        for vr in valid_rules:
+        for vr, validator in self.dict_valid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 self.assertIsNone(validator(self.img))
 
     def test_generate_validator_dict_invalid(self):
-        invalid_rules = [
-            ValidationRuleSize('SIZE', {'gte': 150}),
-            ValidationRuleSize('SIZE', {'lt': 100}),
-            ValidationRuleSize('SIZE', {'lte': 99}),
-            ValidationRuleSize('SIZE', {'gte': 150, 'lte': 100}),
-            ValidationRuleSize('SIZE', {'gte': 99, 'lt': 100, 'ne': 300}),
-            ValidationRuleSize('SIZE', {'ne': 100}),
-            ValidationRuleSize('SIZE', {'eq': 200}),
-        ]
-        for vr in invalid_rules:
+        for vr, validator in self.dict_invalid_validators:
             with self.subTest(vr=vr):
-                validator = vr.generate_validator()
                 with self.assertRaises(ValidationError):
                     validator(self.img)
 
@@ -160,3 +185,21 @@ class ValidationRuleSizeValidatorTestCase(ValidatorTestCase):
         err = 'size error here!'
         with self.assertRaisesMessage(ValidationError, err):
             validator(self.img)
+
+    def test_generate_validator_error_cached_per_language(self):
+        vr = ValidationRuleSize('SIZE', 50)
+        m = MagicMock(wraps=vr.error_message_template)
+        self.addCleanup(swap(ValidationRuleBase, 'error_message_template', m))
+        validator = vr.generate_validator()
+        err = '<strong>100KB</strong> does not meet validation rule: ' \
+              '<strong>equal to 50KB</strong>.'
+        for _ in range(2):
+            with self.assertRaisesMessage(ValidationError, err):
+                validator(self.img)
+        self.assertEqual(m.call_count, 1)
+
+        with translation.override('el'):
+            with self.assertRaises(ValidationError) as cm:
+                validator(self.img)
+        self.assertEqual(m.call_count, 2)
+        self.assertNotIn('does not meet', cm.exception.messages[0])
@@ -6,9 +6,13 @@ from django.test import TestCase
 from vimage.core.base import VimageEntry, VimageConfig
 
 from tests.apps.myapp import models as my_app_models
+from tests.apps.myapp2.models import Hello
 from .const import dotted_path
 
 
+PATCH_GET_REGISTRY = dotted_path('base', 'VimageConfig', 'get_registry')
+
+
 class VimageConfigTestCase(TestCase):
     def test_entry(self):
         vc = VimageConfig({})
@@ -39,280 +43,64 @@ class VimageConfigTestCase(TestCase):
         with self.assertRaises(StopIteration):
             next(gen)
 
-    def test_build_info(self):
+    def test_get_registry(self):
         vc = VimageConfig({
+            'myapp.models.MyModel.img': {
+                'DIMENSIONS': (100, 100),
+            },
             'myapp.models': {
                 'SIZE': 900,
+                'FORMAT': 'png',
             },
             'myapp.models.MyModel': {
                 'SIZE': 500,
             },
+            'myapp.models.GreatModel.picture': {
+                'FORMAT': 'jpeg',
+            },
+            'myapp.models.GreatModel.large_img': {
+                'SIZE': 1000,
+            },
             'myapp2.models': {
-                'DIMENSIONS': (100, 100),
+                'DIMENSIONS': (5, 5),
             },
         })
-        info = vc.build_info()
-        # "info" is a dict
-        self.assertIsInstance(info, dict)
-        # "info" has keys equal to the number of the app_labels declared
-        self.assertEqual(sorted(info.keys()), ['myapp', 'myapp2'])
-        # each value of "info" is a list
-        self.assertIsInstance(info['myapp'], list)
-        self.assertIsInstance(info['myapp2'], list)
-        # The value of the key "myapp" contains 2 elements
-        self.assertEqual(len(info['myapp']), 2)
-        # Each of those elements is a dict with the following keys
-        self.assertEqual(
-            sorted(info['myapp'][0].keys()),
-            ['app_label', 'fields', 'mapping', 'specificity']
-        )
-
-    def test_sort_info(self):
-        orig_info = {
-            'myapp':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img3'],
-                        'specificity': 3,
-                        'mapping': {},
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img3'],
-                        'specificity': 2,
-                        'mapping': {},
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2', 'img3'],
-                        'specificity': 1,
-                        'mapping': {},
-                    },
-                ],
-        }
-        expected_info = {
-            'myapp':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2', 'img3'],
-                        'specificity': 1,
-                        'mapping': {},
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img3'],
-                        'specificity': 2,
-                        'mapping': {},
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img3'],
-                        'specificity': 3,
-                        'mapping': {},
-                    },
-                ],
-        }
-        sorted_info = VimageConfig.sort_info(orig_info)
-        self.assertDictEqual(sorted_info, expected_info)
-
-    def test_build_draft_registry_1(self):
-        info = {
-            'myapp':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2', 'img3'],
-                        'specificity': 1,
-                        'mapping': {
-                            'SIZE': '100',
-                            'DIMENSIONS': '100x100',
-                        }
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img3'],
-                        'specificity': 2,
-                        'mapping': {
-                            'FORMAT': 'png',
-                        }
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img3'],
-                        'specificity': 3,
-                        'mapping': {
-                            'SIZE': '500',
-                            'DIMENSIONS': '500x640',
-                            'FORMAT': 'jpeg',
-                        }
-                    },
-                ],
-        }
-        expected_draft_registry = {
-            'img1': {'SIZE': '100', 'DIMENSIONS': '100x100', 'FORMAT': 'png'},
-            'img2': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img3': {'SIZE': '500', 'DIMENSIONS': '500x640', 'FORMAT': 'jpeg'},
-        }
-        draft_registry = VimageConfig.build_draft_registry(info)
-        self.assertDictEqual(draft_registry, expected_draft_registry)
-
-    def test_build_draft_registry_2(self):
-        info = {
-            'myapp':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2', 'img3'],
-                        'specificity': 1,
-                        'mapping': {
-                            'SIZE': '100',
-                            'DIMENSIONS': '100x100',
-                        }
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img3'],
-                        'specificity': 3,
-                        'mapping': {
-                            'SIZE': '500',
-                            'DIMENSIONS': '500x640',
-                            'FORMAT': 'jpeg',
-                        }
-                    },
-                ],
-        }
-        expected_draft_registry = {
-            'img1': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img2': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img3': {'SIZE': '500', 'DIMENSIONS': '500x640', 'FORMAT': 'jpeg'},
-        }
-        draft_registry = VimageConfig.build_draft_registry(info)
-        self.assertDictEqual(draft_registry, expected_draft_registry)
-
-    def test_build_draft_registry_3(self):
-        info = {
-            'myapp':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2'],
-                        'specificity': 2,
-                        'mapping': {
-                            'FORMAT': 'png',
-                        }
-                    },
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img3', 'img4'],
-                        'specificity': 2,
-                        'mapping': {
-                            'SIZE': '500',
-                            'DIMENSIONS': '500x640',
-                            'FORMAT': 'jpeg',
-                        }
-                    },
-                ],
-        }
-        expected_draft_registry = {
-            'img1': {'FORMAT': 'png'},
-            'img2': {'FORMAT': 'png'},
-            'img3': {'SIZE': '500', 'DIMENSIONS': '500x640', 'FORMAT': 'jpeg'},
-            'img4': {'SIZE': '500', 'DIMENSIONS': '500x640', 'FORMAT': 'jpeg'},
-        }
-        draft_registry = VimageConfig.build_draft_registry(info)
-        self.assertDictEqual(draft_registry, expected_draft_registry)
-
-    def test_build_draft_registry_4(self):
-        info = {
-            'myapp1':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img1', 'img2', 'img3'],
-                        'specificity': 1,
-                        'mapping': {
-                            'SIZE': '100',
-                            'DIMENSIONS': '100x100',
-                        }
-                    },
-                ],
-            'myapp2':
-                [
-                    {
-                        'app_label': 'myapp',
-                        'fields': ['img4', 'img5', 'img6'],
-                        'specificity': 1,
-                        'mapping': {
-                            'DIMENSIONS': '666x666',  # :)
-                        }
-                    },
-                ],
-        }
-        expected_draft_registry = {
-            'img1': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img2': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img3': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img4': {'DIMENSIONS': '666x666'},
-            'img5': {'DIMENSIONS': '666x666'},
-            'img6': {'DIMENSIONS': '666x666'},
-        }
-        draft_registry = VimageConfig.build_draft_registry(info)
-        self.assertDictEqual(draft_registry, expected_draft_registry)
-
-    def test_build_registry_1(self):
-        draft_registry = {
-            'img1': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img2': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img3': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img4': {'DIMENSIONS': '666x666'},
-            'img5': {'DIMENSIONS': '666x666'},
-            'img6': {'DIMENSIONS': '666x666'},
+        fields = {
+            'img': my_app_models.MyModel._meta.get_field('img'),
+            'thumb': my_app_models.AnotherModel._meta.get_field('thumb'),
+            'image': my_app_models.AnotherModel._meta.get_field('image'),
+            'picture': my_app_models.GreatModel._meta.get_field('picture'),
+            'large_img': my_app_models.GreatModel._meta.get_field(
+                'large_img'
+            ),
+            'hello_img': Hello._meta.get_field('img'),
         }
         expected_registry = {
-            'img1': ['100', '100x100'],
-            'img2': ['100', '100x100'],
-            'img3': ['100', '100x100'],
-            'img4': ['666x666'],
-            'img5': ['666x666'],
-            'img6': ['666x666'],
-        }
-        registry = VimageConfig.build_registry(draft_registry)
-        self.assertDictEqual(registry, expected_registry)
-
-    def test_build_registry_2(self):
-        draft_registry = {
-            'img1': {'SIZE': '100', 'DIMENSIONS': '100x100', 'FORMAT': 'png'},
-            'img2': {'SIZE': '100', 'DIMENSIONS': '100x100'},
-            'img3': {'SIZE': '500', 'DIMENSIONS': '500x640', 'FORMAT': 'jpeg'},
+            # more specific entries override less specific ones
+            'img': ['SIZE: 500', 'FORMAT: png', 'DIMENSIONS: (100, 100)'],
+            'thumb': ['SIZE: 900', 'FORMAT: png'],
+            'image': ['SIZE: 900', 'FORMAT: png'],
+            # same specificity, different fields
+            'picture': ['SIZE: 900', 'FORMAT: jpeg'],
+            'large_img': ['SIZE: 1000', 'FORMAT: png'],
+            # another app
+            'hello_img': ['DIMENSIONS: (5, 5)'],
         }
-        expected_registry = {
-            'img1': ['100', '100x100', 'png'],
-            'img2': ['100', '100x100'],
-            'img3': ['500', '500x640', 'jpeg'],
-        }
-        registry = VimageConfig.build_registry(draft_registry)
-        self.assertDictEqual(registry, expected_registry)
-
-    def test_add_validators_methods_called(self):
-        m_path = dotted_path('base', 'VimageConfig', 'build_info')
-        with patch(m_path) as m:
-            VimageConfig({'myapp': {}}).add_validators()
-            self.assertTrue(m.called)
-
-        m_path = dotted_path('base', 'VimageConfig', 'sort_info')
-        with patch(m_path) as m:
-            VimageConfig({'myapp': {}}).add_validators()
-            self.assertTrue(m.called)
-
-        m_path = dotted_path('base', 'VimageConfig', 'build_draft_registry')
-        with patch(m_path) as m:
-            VimageConfig({'myapp': {}}).add_validators()
-            self.assertTrue(m.called)
+        registry = vc.get_registry()
+        # validators are regenerated on each build; compare their rules
+        self.assertDictEqual(
+            {
+                field: [validator.__doc__ for validator in validators]
+                for field, validators in registry.items()
+            },
+            {
+                fields[name]: rules
+                for name, rules in expected_registry.items()
+            }
+        )
 
-        m_path = dotted_path('base', 'VimageConfig', 'build_registry')
-        with patch(m_path) as m:
+    def test_add_validators_get_registry_called(self):
+        with patch(PATCH_GET_REGISTRY) as m:
             VimageConfig({'myapp': {}}).add_validators()
             self.assertTrue(m.called)
 
@@ -384,3 +172,16 @@ class VimageConfigAddValidatorsTestCase(TestCase):
         })
         vc.add_validators()
         self.assertEqual(len(self.img.validators), 3)
+
+    def test_add_validators_tuple_validators(self):
+        existing_validator = object()
+        self.img.validators = (existing_validator,)
+        vc = VimageConfig({
+            'myapp.models.MyModel.img': {
+                'SIZE': 1000,
+            }
+        })
+        vc.add_validators()
+        self.assertIsInstance(self.img.validators, list)
+        self.assertEqual(len(self.img.validators), 2)
+        self.assertIs(self.img.validators[0], existing_validator)
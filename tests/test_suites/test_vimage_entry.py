@@ -7,6 +7,10 @@ from vimage.core.base import VimageKey, VimageValue, VimageEntry
 from .const import dotted_path
 
 
+PATCH_KEY_IS_VALID = dotted_path('base', 'VimageKey', 'is_valid')
+PATCH_VALUE_IS_VALID = dotted_path('base', 'VimageValue', 'is_valid')
+
+
 class VimageEntryTestCase(TestCase):
     def test_entry(self):
         ve = VimageEntry('app', {})
@@ -28,45 +32,49 @@ class VimageEntryTestCase(TestCase):
         self.assertIsInstance(eval(repr(ve)), VimageEntry)
 
     def test_is_valid(self):
-        m_path = dotted_path('base', 'VimageKey', 'is_valid')
-        with patch(m_path) as m:
+        with patch(PATCH_KEY_IS_VALID) as m:
             ve = VimageEntry('myapp.models', {'SIZE': 10})
             ve.is_valid()
             self.assertTrue(m.called)
 
-        m_path = dotted_path('base', 'VimageValue', 'is_valid')
-        with patch(m_path) as m:
+        with patch(PATCH_VALUE_IS_VALID) as m:
             ve = VimageEntry('myapp.models', {'SIZE': 10})
             ve.is_valid()
             self.assertTrue(m.called)
 
-    def test_app_label(self):
-        m_path = dotted_path('base', 'VimageKey', 'get_app_label')
-        with patch(m_path) as m:
-            ve = VimageEntry('myapp.models', {'SIZE': 10})
-            label = ve.app_label
-            self.assertTrue(m.called)
+    @patch(dotted_path('base', 'VimageKey', 'get_app_label'))
+    def test_app_label(self, m):
+        ve = VimageEntry('myapp.models', {'SIZE': 10})
+        label = ve.app_label
+        self.assertTrue(m.called)
 
-    def test_fields(self):
-        m_path = dotted_path('base', 'VimageKey', 'get_fields')
-        with patch(m_path) as m:
-            ve = VimageEntry('myapp.models', {'SIZE': 10})
-            sp = ve.fields
-            self.assertTrue(m.called)
+    @patch(dotted_path('base', 'VimageKey', 'get_fields'))
+    def test_fields(self, m):
+        ve = VimageEntry('myapp.models', {'SIZE': 10})
+        sp = ve.fields
+        self.assertTrue(m.called)
 
-    def test_specificity(self):
-        m_path = dotted_path('base', 'VimageKey', 'get_specificity')
-        with patch(m_path) as m:
-            ve = VimageEntry('myapp.models', {'SIZE': 10})
-            sp = ve.specificity
-            self.assertTrue(m.called)
+    @patch(dotted_path('base', 'VimageKey', 'get_specificity'))
+    def test_specificity(self, m):
+        ve = VimageEntry('myapp.models', {'SIZE': 10})
+        sp = ve.specificity
+        self.assertTrue(m.called)
 
-    def test_mapping(self):
-        m_path = dotted_path('base', 'VimageValue', 'type_validator_mapping')
-        with patch(m_path) as m:
-            ve = VimageEntry('myapp.models', {'SIZE': 10})
-            sp = ve.mapping
-            self.assertTrue(m.called)
+    @patch(dotted_path('base', 'VimageValue', 'type_validator_mapping'))
+    def test_mapping(self, m):
+        ve = VimageEntry('myapp.models', {'SIZE': 10})
+        sp = ve.mapping
+        self.assertTrue(m.called)
+
+    @patch(dotted_path('base', 'VimageValue', 'type_validator_mapping'))
+    @patch(dotted_path('base', 'VimageKey', 'get_fields'))
+    def test_fields_mapping_computed_once(self, m_fields, m_mapping):
+        ve = VimageEntry('myapp.models', {'SIZE': 10})
+        self.assertIs(ve.entry_info, ve.entry_info)
+        self.assertIs(ve.fields, ve.fields)
+        self.assertIs(ve.mapping, ve.mapping)
+        self.assertEqual(m_fields.call_count, 1)
+        self.assertEqual(m_mapping.call_count, 1)
 
     def test_entry_info(self):
         ve = VimageEntry('myapp.models', {'SIZE': 10})
@@ -48,6 +48,9 @@ class VimageKeyTestCase(TestCase):
     def test_split_key(self):
         vk = VimageKey('myapp.models.MyModel')
         self.assertListEqual(vk.split_key(), ['myapp', 'models', 'MyModel'])
+        # the returned list is a copy; mutating it leaves the key intact
+        vk.split_key().pop()
+        self.assertListEqual(vk.split_key(), ['myapp', 'models', 'MyModel'])
         vk = VimageKey('')
         self.assertListEqual(vk.split_key(), [''])
 
@@ -126,6 +129,21 @@ class VimageKeyTestCase(TestCase):
         with self.assertRaisesMessage(InvalidKeyError, err):
             vk.validate_dotted_key()
 
+        # Model names are case-sensitive
+        vk = VimageKey('myapp.models.mymodel')
+        err = '[myapp.models.mymodel]: The model "mymodel" ' \
+              'does not exist! ' \
+              'Available model names: "MyModel, AnotherModel, GreatModel".'
+        with self.assertRaisesMessage(InvalidKeyError, err):
+            vk.validate_dotted_key()
+
+        # An ImageField of another model of the app
+        vk = VimageKey('myapp.models.MyModel.thumb')
+        err = '[myapp.models.MyModel.thumb]: The field "thumb" does not ' \
+              'exist! Available ImageField names: "img".'
+        with self.assertRaisesMessage(InvalidKeyError, err):
+            vk.validate_dotted_key()
+
         # A valid app, with "models" module, but non-valid ImageField
         vk = VimageKey('myapp2.models.Hello.image')
         err = f'[myapp2.models.Hello.image]: The field "image" does not ' \
@@ -142,6 +160,11 @@ class VimageKeyTestCase(TestCase):
             VimageKey(''),
             VimageKey('myapp.class'),
             VimageKey('myapp.def'),
+            VimageKey('myapp..models'),
+            VimageKey('myapp.models.'),
+            VimageKey('myapp.1models'),
+            VimageKey('myapp.models\n'),
+            VimageKey('my-app.models'),
         ]
         for vk in invalid_keys:
             with self.subTest(vk=vk):
@@ -150,6 +173,7 @@ class VimageKeyTestCase(TestCase):
         valid_keys = [
             VimageKey('myapp'),
             VimageKey('myapp.something.other'),
+            VimageKey('_my_app2.models.Model_3'),
         ]
         for vk in valid_keys:
             with self.subTest(vk=vk):
@@ -10,6 +10,11 @@ from vimage.core.exceptions import InvalidValueError
 from .const import CORE, dotted_path
 
 
+PATCH_NONSENSE_KEYS = dotted_path('base', 'VimageValue',
+                                  'nonsense_keys_together')
+PATCH_VALIDATE_VALUE = dotted_path('base', 'VimageValue', 'validate_value')
+
+
 class VimageValueTestCase(TestCase):
     def test_value(self):
         vv = VimageValue({})
@@ -65,6 +70,17 @@ class VimageValueTestCase(TestCase):
             validator_types.ValidationRuleAspectRatio
         )
 
+    def test_validation_rules(self):
+        vv = VimageValue({'SIZE': 15, 'FORMAT': 'png'})
+        rules = vv.validation_rules
+        self.assertIsInstance(rules, list)
+        self.assertIsInstance(rules[0], validator_types.ValidationRuleSize)
+        self.assertIsInstance(rules[1], validator_types.ValidationRuleFormat)
+        self.assertListEqual(
+            [type(vr) for vr in vv.validation_rule_generator()],
+            [type(vr) for vr in rules]
+        )
+
     def test_validate_value(self):
         """ Test that is_valid() method is called """
         mappings = {
@@ -107,14 +123,12 @@ class VimageValueTestCase(TestCase):
             'ASPECT_RATIO': 1,
         }
         vv = VimageValue(value)
-        with patch(dotted_path('base', 'VimageValue',
-                               'nonsense_keys_together')) as m:
+        with patch(PATCH_NONSENSE_KEYS) as m:
             with self.assertRaises(InvalidValueError):
                 vv.is_valid()
                 self.assertTrue(m.called)
 
         vv = VimageValue({'FORMAT': 'jpeg'})
-        m_path = dotted_path('base', 'VimageValue', 'validate_value')
-        with patch(m_path) as m:
+        with patch(PATCH_VALIDATE_VALUE) as m:
             vv.is_valid()
             self.assertTrue(m.called)
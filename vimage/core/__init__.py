@@ -1,6 +1,5 @@
 from django.conf import settings
 
-from .base import VimageConfig
 from .const import CONFIG_NAME
 
 
@@ -11,5 +10,6 @@ def add_validators():
     to each ImageField's 'validators' attribute.
     :return: None
     """
+    from .base import VimageConfig
     vc = VimageConfig(getattr(settings, CONFIG_NAME))
     vc.add_validators()
@@ -1,15 +1,57 @@
+import re
 from keyword import iskeyword
-from collections import defaultdict
+from operator import itemgetter
 
 from django.apps import apps
 from django.apps.config import MODELS_MODULE_NAME
 from django.db.models.fields.files import ImageField
+from django.utils.functional import cached_property
 
 from .exceptions import InvalidKeyError, InvalidValueError
-from .const import CONFIG_NAME, nonsense_values_together
+from .const import CONFIG_NAME, nonsense_values_pairs
 from .validator_types import validation_rule_factory
 
 
+# Identifiers (a letter or underscore followed by word characters)
+# separated by single dots.
+_dotted_path = re.compile(r'[^\W\d]\w*(?:\.[^\W\d]\w*)*')
+
+
+def _model_image_fields(app_label, model_name):
+    """
+    All the :class:`~django.db.models.ImageField` fields of a model.
+
+    :param str app_label: the app label of the model
+    :param str model_name: the model name
+    :return: tuple of Django ``ImageField`` objects
+    """
+    model = apps.get_model(app_label=app_label, model_name=model_name)
+    # ImageFields are always concrete, so there is no need to materialize
+    # the many-to-many and reverse relation fields "get_fields()" includes.
+    # Unlike "local_fields", "concrete_fields" also covers fields inherited
+    # through multi-table inheritance.
+    return tuple(
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, ImageField)
+    )
+
+
+def _app_image_fields(app_label):
+    """
+    All the :class:`~django.db.models.ImageField` fields of an app.
+
+    :param str app_label: the app label
+    :return: tuple of Django ``ImageField`` objects
+    """
+    app_config = apps.get_app_config(app_label=app_label)
+    return tuple(
+        field
+        for model in app_config.get_models()
+        for field in _model_image_fields(app_label, model.__name__)
+    )
+
+
 class VimageKey:
     def __init__(self, key):
         """
@@ -26,6 +68,8 @@ class VimageKey:
                             f'<str> type. Current key: "{key}", is '
                             f'<{type(key).__name__}>!')
         self.key = key
+        # The key never changes, so split it once
+        self._parts = tuple(key.split('.'))
 
     def __str__(self):
         return self.key
@@ -34,7 +78,7 @@ class VimageKey:
         return f'{self.__class__.__name__}({self.key!r})'
 
     def split_key(self):
-        return self.key.split('.')
+        return list(self._parts)
 
     @staticmethod
     def models_in_key(keywords):
@@ -54,7 +98,7 @@ class VimageKey:
         :param list keywords: list of strings
         :return: boolean
         """
-        return len(keywords) in range(2, 5)
+        return 2 <= len(keywords) <= 4
 
     def key_non_empty_str(self):
         """
@@ -76,16 +120,15 @@ class VimageKey:
 
         :return: boolean
         """
-        start = f'[{self.key}]:'
-        keywords = self.split_key()
+        keywords = self._parts
         if not self.valid_key_length(keywords):
-            err = f'{start} The key must consists of two to four words, ' \
-                  f'separated by dot. It must be a path to one of ' \
+            err = f'[{self.key}]: The key must consists of two to four ' \
+                  f'words, separated by dot. It must be a path to one of ' \
                   f'the following: the "models" module, ' \
                   f'a Django Model class or a Django ImageField field.'
             raise InvalidKeyError(err)
         if not self.models_in_key(keywords):
-            err = f'{start} The second word of the key, should be ' \
+            err = f'[{self.key}]: The second word of the key, should be ' \
                   f'"{MODELS_MODULE_NAME}", not "{keywords[1]}"!'
             raise InvalidKeyError(err)
         app_label = keywords[0]
@@ -93,37 +136,40 @@ class VimageKey:
             app_config = apps.get_app_config(app_label=app_label)
             models_module = app_config.models_module.__name__  # noqa: F841
         except LookupError:
-            err = f'{start} The app "{app_label}" is either not in ' \
+            err = f'[{self.key}]: The app "{app_label}" is either not in ' \
                   f'"INSTALLED_APPS" or it does not exist!'
             raise InvalidKeyError(err)
         except AttributeError:
-            err = f'{start} The app "{app_label}" has no "models" ' \
+            err = f'[{self.key}]: The app "{app_label}" has no "models" ' \
                   f'module defined. Are you sure it exists?'
             raise InvalidKeyError(err)
         else:
             # By now the app exists and has a "models" module
             if len(keywords) == 2:
                 return
-            keywords = keywords[2:]
+            keywords = list(keywords[2:])
             # by now keywords should be at least ['<ModelName>']
-            model_classes = list(app_config.get_models())
-            model_names = [m.__name__ for m in model_classes]
             model_name = keywords.pop(0)
-            if model_name not in model_names:
-                err = f'{start} The model "{model_name}" does not exist! ' \
-                      f'Available model names: "{", ".join(model_names)}".'
+            try:
+                model = app_config.get_model(model_name)
+            except LookupError:
+                model = None
+            # "get_model" is case-insensitive; the key is not
+            if model is None or model.__name__ != model_name:
+                model_names = [m.__name__ for m in app_config.get_models()]
+                err = f'[{self.key}]: The model "{model_name}" does not ' \
+                      f'exist! Available model names: ' \
+                      f'"{", ".join(model_names)}".'
                 raise InvalidKeyError(err)
             # by now keywords should be just the field's name ['<ImageField>']
             if len(keywords) == 1:
+                field_name = keywords.pop(0)
                 image_field_names = [
                     field.name
-                    for model in model_classes
-                    for field in model._meta.get_fields()
-                    if isinstance(field, ImageField)
+                    for field in _model_image_fields(app_label, model_name)
                 ]
-                field_name = keywords.pop(0)
                 if field_name not in image_field_names:
-                    err = f'{start} The field "{field_name}" does not ' \
+                    err = f'[{self.key}]: The field "{field_name}" does not ' \
                           f'exist! Available ImageField names: ' \
                           f'"{", ".join(image_field_names)}".'
                     raise InvalidKeyError(err)
@@ -138,13 +184,9 @@ class VimageKey:
 
         :return: boolean
         """
-        split_path = self.split_key()
-        return all([
-            True
-            if word.isidentifier() and not iskeyword(word)
-            else False
-            for word in split_path
-        ])
+        if _dotted_path.fullmatch(self.key) is None:
+            return False
+        return not any(iskeyword(word) for word in self._parts)
 
     def validate_key(self):
         if not self.key_valid_dotted_format():
@@ -161,15 +203,7 @@ class VimageKey:
 
         :return: list of Django ``ImageField`` objects
         """
-        keywords = self.split_key()
-        app_config = apps.get_app_config(app_label=keywords[0])
-        app_models = app_config.get_models()
-        return [
-            field
-            for model in app_models
-            for field in model._meta.get_fields()
-            if isinstance(field, ImageField)
-        ]
+        return list(_app_image_fields(self._parts[0]))
 
     def get_specific_model_img_fields(self):
         """
@@ -179,13 +213,8 @@ class VimageKey:
 
         :return: list of Django ``ImageField`` objects
         """
-        keywords = self.split_key()
-        model = apps.get_model(app_label=keywords[0], model_name=keywords[-1])
-        return [
-            field
-            for field in model._meta.get_fields()
-            if isinstance(field, ImageField)
-        ]
+        keywords = self._parts
+        return list(_model_image_fields(keywords[0], keywords[-1]))
 
     def get_img_field(self):
         """
@@ -195,7 +224,7 @@ class VimageKey:
 
         :return: list with one element (``ImageField`` object)
         """
-        keywords = self.split_key()
+        keywords = self._parts
         model = apps.get_model(app_label=keywords[0], model_name=keywords[-2])
         return [model._meta.get_field(keywords[-1])]
 
@@ -217,8 +246,8 @@ class VimageKey:
 
         :return: int
         """
-        keywords_len = len(self.split_key())
-        if keywords_len not in range(2, 5):
+        keywords_len = len(self._parts)
+        if not 2 <= keywords_len <= 4:
             return 0
         return keywords_len - 1
 
@@ -233,7 +262,7 @@ class VimageKey:
 
         :return: str, the app label of the key
         """
-        return self.split_key()[0]
+        return self._parts[0]
 
     def get_fields(self):
         """
@@ -280,6 +309,7 @@ class VimageValue:
                             f'<{type(value).__name__}>!')
         self.value = value
         self.validators = []
+        self._keyset = frozenset(value)
 
     def __str__(self):
         return str(self.value)
@@ -287,6 +317,19 @@ class VimageValue:
     def __repr__(self):
         return f'{self.__class__.__name__}({self.value!r})'
 
+    @property
+    def validation_rules(self):
+        """
+        Depending on the key:value pairs of ``self.value``, returns the
+        corresponding class instances of these validation types.
+
+        :return: list of class instances
+        """
+        return [
+            validation_rule_factory(key, value)
+            for key, value in self.value.items()
+        ]
+
     def validation_rule_generator(self):
         """
         Depending on the key:value pair of ``self.value``, returns the
@@ -294,8 +337,7 @@ class VimageValue:
 
         :return: class instance
         """
-        for key, value in self.value.items():
-            yield validation_rule_factory(key, value)
+        yield from self.validation_rules
 
     def validate_value(self):
         """
@@ -303,7 +345,7 @@ class VimageValue:
 
         :return: None or raises ``InvalidValueError``
         """
-        for vr in self.validation_rule_generator():
+        for vr in self.validation_rules:
             vr.is_valid()
 
     def nonsense_keys_together(self):
@@ -313,9 +355,8 @@ class VimageValue:
 
         :return: None or raises ``InvalidValueError``
         """
-        set_keys = set(self.value.keys())
-        for nonsense_value_together in nonsense_values_together():
-            if nonsense_value_together.issubset(set_keys):
+        for nonsense_value_together in nonsense_values_pairs:
+            if nonsense_value_together <= self._keyset:
                 err = f'The value "{self.value}" contains nonsense values ' \
                       f'that together will not work! Use one of these.' \
                       f'Nonsense values together: ' \
@@ -339,7 +380,7 @@ class VimageValue:
         """
         return {
             vr.name: vr.generate_validator()
-            for vr in self.validation_rule_generator()
+            for vr in self.validation_rules
         }
 
     def is_valid(self):
@@ -402,7 +443,7 @@ class VimageEntry:
         self.key.is_valid()
         self.value.is_valid()
 
-    @property
+    @cached_property
     def app_label(self):
         """
         Calls :meth:`~vimage.core.base.VimageKey.get_app_label`
@@ -411,7 +452,7 @@ class VimageEntry:
         """
         return self.key.get_app_label()
 
-    @property
+    @cached_property
     def fields(self):
         """
         Calls :meth:`~vimage.core.base.VimageKey.get_fields`
@@ -420,7 +461,7 @@ class VimageEntry:
         """
         return self.key.get_fields()
 
-    @property
+    @cached_property
     def specificity(self):
         """
         Calls :meth:`~vimage.core.base.VimageKey.get_specificity`
@@ -429,7 +470,7 @@ class VimageEntry:
         """
         return self.key.get_specificity()
 
-    @property
+    @cached_property
     def mapping(self):
         """
         Calls :meth:`~vimage.core.base.VimageValue.type_validator_mapping`
@@ -438,7 +479,7 @@ class VimageEntry:
         """
         return self.value.type_validator_mapping()
 
-    @property
+    @cached_property
     def entry_info(self):
         """
         Provides the ``app_label``, ``specificity``, ``fields`` and
@@ -497,143 +538,58 @@ class VimageConfig:
         for key, value in self.config.items():
             yield VimageEntry(key, value)
 
-    def build_info(self):
+    def get_registry(self):
         """
-        Given each ``VimageEntry`` object, build a dict with ``app_label`` as
-        the key and ``VimageEntry.entry_info`` dict as the value.
-        In other words, put entries that belong to the same app, inside a
-        single *bucket*. Next step, is to sort, each bucket, by specificity.
-
-        Return example::
+        Builds the registry, which is the basis of adding the validators
+        into each ``ImageField``, in the following pattern::
 
             {
-                'myapp':
-                    [
-                        {
-                            'app_label': 'myapp',
-                            'fields': [<ImageField1>, <ImageField2>, ...],
-                            'specificity': 2,
-                            'mapping': {
-                                'SIZE': <ValidationRuleSize.validator>,
-                                'FORMAT': <ValidationRuleFormat.validator>
-                            },
-                       },
-                       {
-                            'app_label': 'myapp',
-                            'fields': [<ImageField1>, <ImageField2>, ...],
-                            'specificity': 1,
-                            'mapping': {
-                                'SIZE': <ValidationRuleSize.validator>
-                            },
-                       }
-                    ],
-                'myapp2':
-                    [
-                        {
-                            'app_label': 'myapp2',
-                            'fields': [<ImageField1>],
-                            'specificity': 3,
-                            'mapping': {
-                                'FORMAT': <ValidationRuleFormat.validator>
-                            }
-                        },
-                    ],
-                ...
+                <field1>: [<validator>, <validator>, ...],
+                <field2>: [<validator>, ...],
             }
 
-        :return: dict
-        """
-        info = defaultdict(list)
-        for vimage_entry in self.vimage_entry_generator():
-            entry_info = vimage_entry.entry_info
-            info[entry_info['app_label']].append(entry_info)
-        return info
-
-    @staticmethod
-    def sort_info(info):
-        """
-        Sorts the list inside each bucket per specificity.
-        Lower specificity comes first.
-
-        :param dict info: dict of useful info about the VimageEntry
-        :return: dict
-        """
-        for value in info.values():
-            value.sort(key=lambda d: d['specificity'])
-        return info
-
-    @staticmethod
-    def build_draft_registry(info):
-        """
-        Builds the draft registry, dict, in the following pattern::
-
-            {
-                <field1>: {'validator_name': <validator>, ...}
-                <field2>: {'validator_name': <validator>, ...}
-            }
+        A single list of ``(app_label, specificity, fields, mapping)`` tuples
+        is sorted once. Entries of the same app end up next to each other,
+        ordered by specificity (lower first, the sort is stable), so merging
+        them in order lets the validators of the more specific entries
+        override the ones of the less specific entries. I.e, the validators
+        of ``'myapp.models.MyModel.img'`` override those of
+        ``'myapp.models.MyModel'`` which override those of
+        ``'myapp.models'``, for the ``img`` field.
 
-        Think of the ``draft_registry`` as a pre-build of the
-        ``self.registry``.
-        Because each "info bucket" is sorted by specificity, the first
-        "info" element in each "bucket" will always be a subset of the next
-        one.
-        If all elements inside the bucket have the same specificity then they
-        will refer to different fields, thus, different keys inside
-        ``self.draft_registry``.
-        If a "bucket list" has three different elements with 1, 2, 3
-        specificity values, respectively, then the specific ``ImageField``
-        of the last element (specificity == 3) will override any given
-        validators from the previous elements (specificity in [1, 2]).
-
-        :param dict info: dict of useful info about the VimageEntry
         :return: dict
         """
+        entries = sorted(
+            (
+                (entry.app_label, entry.specificity, entry.fields,
+                 entry.mapping)
+                for entry in self.vimage_entry_generator()
+            ),
+            key=itemgetter(0, 1)
+        )
         draft_registry = {}
-        # info is a DefaultDict <str>: <list>
-        for values in info.values():
-            # values == list of one or more dicts (see "_build_info" docstring)
-            for d in values:
-                # each d is a dict
-                for field in d['fields']:
-                    mapping = d['mapping']
-                    if field not in draft_registry:
-                        # New field for validation. Add it.
-                        # Extra caution here due to reference by name.
-                        # A new dict (with new id) must be added to each field.
-                        draft_registry[field] = {
-                            k: v for k, v in mapping.items()
-                        }
-                    else:
-                        # update/insert validator to existing field
-                        for k, v in mapping.items():
-                            draft_registry[field][k] = v
-        return draft_registry
-
-    @staticmethod
-    def build_registry(draft_registry):
-        """
-        Given the ``draft_registry`` dict, construct the main registry which
-        is the basis of adding the validators into each ``ImageField``.
-
-        :param dict draft_registry: a helper dict to help build the registry
-        :return: dict
-        """
-        registry = {}
-        for field, mapping in draft_registry.items():
-            registry[field] = list(mapping.values())
-        return registry
+        for _, _, fields, mapping in entries:
+            for field in fields:
+                if field in draft_registry:
+                    # update/insert validator to existing field
+                    draft_registry[field].update(mapping)
+                else:
+                    # New field for validation. A new dict must be added to
+                    # each field since "mapping" is shared between fields.
+                    draft_registry[field] = mapping.copy()
+        return {
+            field: list(mapping.values())
+            for field, mapping in draft_registry.items()
+        }
 
     def add_validators(self):
         """
-        The entry point where the ``draft_registry`` and the ``registry`` are
-        build and, finally, the validators are added to the corresponding
-        ``ImageField`` fields.
+        The entry point where the registry is built and, finally, the
+        validators are added to the corresponding ``ImageField`` fields.
 
         :return: None
         """
-        info = self.build_info()
-        sorted_info = self.sort_info(info)
-        draft_registry = self.build_draft_registry(sorted_info)
-        registry = self.build_registry(draft_registry)
-        for field, validators in registry.items():
-            field.validators += validators
+        for field, validators in self.get_registry().items():
+            if not isinstance(field.validators, list):
+                field.validators = list(field.validators)
+            field.validators.extend(validators)
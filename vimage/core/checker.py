@@ -1,7 +1,6 @@
 from django.conf import settings
 
 from .const import APP_NAME, CONFIG_NAME
-from .base import VimageEntry
 from . import exceptions
 
 
@@ -34,5 +33,8 @@ def configuration_check():
         raise exceptions.EmptyConfigError(error)
 
     # 4. Is each key-value pair valid?
+    # Imported here, so that the validation machinery is only loaded
+    # when there is a non-empty config to check.
+    from .base import VimageEntry
     for key, value in config.items():
         VimageEntry(key, value).is_valid()
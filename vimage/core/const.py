@@ -2,10 +2,8 @@ import operator
 
 from django.utils.translation import gettext_lazy as _
 
-from vimage.apps import VimageConfig
 
-
-APP_NAME = VimageConfig.name
+APP_NAME = 'vimage'  # vimage.apps.VimageConfig.name
 CONFIG_NAME = 'VIMAGE'
 
 type_size = 'SIZE'
@@ -17,6 +15,7 @@ type_mode = 'MODE'  # TODO: Add a MODE validation?
 valid_types_strings = [
     type_size, type_dimensions, type_format, type_aspect_ratio,  # type_mode
 ]
+valid_types_str = ', '.join(valid_types_strings)
 
 trans_type = {
     type_size: _('SIZE'),
@@ -33,7 +32,7 @@ err = 'err'
 
 w = 'w'
 h = 'h'
-width_height_operators = {w, h}
+width_height_operators = frozenset({w, h})
 
 trans_wh = {
     w: _('width'),
@@ -57,6 +56,10 @@ comparison_operators = {
 }
 valid_operators_strings = list(comparison_operators.keys())
 
+# Operators that may be applied to str (not int), along with the "err" key
+valid_str_keys = (eq, ne, err)
+valid_str_keys_str = ', '.join(valid_str_keys)
+
 human_opr = {
     lt: _('less than'),
     lte: _('less than or equal to'),
@@ -67,6 +70,8 @@ human_opr = {
 }
 
 allowable_web_image_extensions = ['jpeg', 'png', 'gif', 'bmp', 'webp']
+allowable_web_image_extensions_set = frozenset(allowable_web_image_extensions)
+allowable_web_image_extensions_str = ', '.join(allowable_web_image_extensions)
 
 
 errors = {
@@ -75,6 +80,34 @@ errors = {
 }
 
 
+# Operators that make no sense to appear together in a single validation
+# rule. See "nonsense_operators()".
+nonsense_operators_pairs = (
+    frozenset({lt, lte}),  # "less than" and "less than or equal"? Nonsense
+    frozenset({gt, gte}),  # "greater than" and "greater than or equal"?
+    frozenset({lt, eq}),  # "less than" and "equal"? Nonsense
+    frozenset({gt, eq}),  # "greater than" and "equal"? Nonsense
+    frozenset({lte, eq}),  # "less than or equal" and "equal"? Nonsense
+    frozenset({gte, eq}),  # "greater than" and "equal"? Nonsense
+    frozenset({ne, eq}),  # "equal" and "non equal"? Nonsense
+)
+
+# A distinct bit per operator, so that a set of operators maps to an int
+operator_bits = {
+    opr: 1 << i for i, opr in enumerate(valid_operators_strings)
+}
+# (bit mask, pair) of every nonsense pair of operators
+nonsense_operators_masks = tuple(
+    (sum(operator_bits[opr] for opr in pair), pair)
+    for pair in nonsense_operators_pairs
+)
+
+# Mutually exclusive value keys. See "nonsense_values_together()".
+nonsense_values_pairs = (
+    frozenset({type_dimensions, type_aspect_ratio}),
+)
+
+
 def nonsense_operators():
     """
     A list of sets which makes no sense to appear together in a single
@@ -83,17 +116,9 @@ def nonsense_operators():
     AND less than or equal 1100px``.
     Or, ``greater than 500px and equal to 785px``!
 
-    :return: list of 2-length sets
+    :return: list of 2-length frozensets
     """
-    return [
-        {lt, lte},  # "less than" and "less than or equal"? Nonsense
-        {gt, gte},  # "greater than" and "greater than or equal"? Nonsense
-        {lt, eq},  # "less than" and "equal"? Nonsense
-        {gt, eq},  # "greater than" and "equal"? Nonsense
-        {lte, eq},  # "less than or equal" and "equal"? Nonsense
-        {gte, eq},  # "greater than" and "equal"? Nonsense
-        {ne, eq},  # "equal" and "non equal"? Nonsense
-    ]
+    return list(nonsense_operators_pairs)
 
 
 def nonsense_values_together():
@@ -105,11 +130,9 @@ def nonsense_values_together():
     ``'DIMENSIONS'`` and ``'ASPECT_RATIO'`` validation strings.
     Every pair inside this list is mutual exclusive.
 
-    :return: list of 2-length sets
+    :return: list of 2-length frozensets
     """
-    return [
-        {type_dimensions, type_aspect_ratio},
-    ]
+    return list(nonsense_values_pairs)
 
 
 def docstring_parameter(*args, **kwargs):
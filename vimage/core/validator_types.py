@@ -1,8 +1,9 @@
+from functools import wraps
+
 from PIL import Image
 
 from django.core.validators import ValidationError
-from django.core.files.images import get_image_dimensions
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_lazy as _, get_language
 from django.utils.safestring import mark_safe
 from django.utils.html import strip_tags
 
@@ -13,12 +14,76 @@ from .exceptions import InvalidValueError
 # TODO: Move staticmethods to utils.py
 
 
+def freeze_rule(rule):
+    """
+    Converts ``rule`` into a hashable form. Order and type are preserved so
+    that, i.e, ``1`` and ``1.0`` or a tuple and a list never compare equal.
+
+    :param rule: the rule of a validation type
+    :return: tuple
+    """
+    if isinstance(rule, dict):
+        return dict, tuple((k, freeze_rule(v)) for k, v in rule.items())
+    if isinstance(rule, (list, tuple)):
+        return type(rule), tuple(freeze_rule(v) for v in rule)
+    return type(rule), rule
+
+
+def cache_human_rule(humanize_rule):
+    """
+    A decorator that memoizes a ``humanize_rule`` method per
+    ``(name, rule, language)``, since the humanized rule is translated.
+
+    :param humanize_rule: the ``humanize_rule`` method of a validation type
+    :return: function
+    """
+    cache = {}
+
+    @wraps(humanize_rule)
+    def wrapper(self):
+        key = (self.name, freeze_rule(self.rule), get_language())
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable rule, i.e, not validated yet
+            return humanize_rule(self)
+        human_rule = cache[key] = humanize_rule(self)
+        return human_rule
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def image_info(value):
+    """
+    Returns the dimensions and the (lowercase) format of the uploaded image,
+    ``value``, parsing its header once. The position of the file is restored
+    afterwards.
+
+    :param value: the uploaded image (a file-like object)
+    :return: tuple ((width, height), str)
+    """
+    position = value.tell()
+    value.seek(0)
+    try:
+        # By now, PIL.Image.verify() has run and "value" is a valid image.
+        image = Image.open(value)
+        return image.size, image.format.lower()
+    finally:
+        value.seek(position)
+
+
 class ValidationRuleBase:
+    __slots__ = ('name', 'rule', 'trans_name', '_error_templates')
+
+    equal = staticmethod(const.comparison_operators[const.eq])
+
     def __init__(self, name, rule):
         self.name = name
         self.rule = rule
-        self.equal = const.comparison_operators[const.eq]
         self.trans_name = const.trans_type.get(self.name)
+        # The (translated) default error message per language
+        self._error_templates = {}
 
     def __str__(self):
         return f'{self.name}: {self.rule}'
@@ -56,13 +121,9 @@ class ValidationRuleBase:
         :param iterable: an iterable of positive ints
         :return: boolean
         """
-        if iterable:
-            return all(
-                map(lambda x:
-                    isinstance(x, int) and self.positive_num(x),
-                    iterable)
-            )
-        return False
+        return bool(iterable) and all(
+            isinstance(x, int) and x > 0 for x in iterable
+        )
 
     def positive_two_len_tuple(self, t):
         """
@@ -81,9 +142,8 @@ class ValidationRuleBase:
         :param tuple t: a tuple of two positive ints
         :return: boolean
         """
-        if isinstance(t, tuple):
-            return len(t) == 2 and self.positive_elements(t)
-        return False
+        return isinstance(t, tuple) and len(t) == 2 \
+            and self.positive_elements(t)
 
     def positive_list(self, ls):
         """
@@ -103,9 +163,8 @@ class ValidationRuleBase:
         :return: boolean
         """
         if isinstance(ls, list) and ls:
-            return all(
-                [self.positive_two_len_tuple(t) for t in ls]
-            )
+            positive_two_len_tuple = self.positive_two_len_tuple
+            return all(positive_two_len_tuple(t) for t in ls)
         return False
 
     def only_err_key(self, keys):
@@ -151,9 +210,12 @@ class ValidationRuleBase:
         :param keys: the ``dict_keys`` (operators) of the rule
         :return: None or raises ``InvalidValueError`` exception
         """
-        set_keys = set(keys)
-        for nonsense_operator in const.nonsense_operators():
-            if nonsense_operator.issubset(set_keys):
+        operator_bits = const.operator_bits
+        mask = 0
+        for key in keys:
+            mask |= operator_bits.get(key, 0)
+        for nonsense_mask, nonsense_operator in const.nonsense_operators_masks:
+            if mask & nonsense_mask == nonsense_mask:
                 err = f'Encountered nonsense operators, ' \
                       f'"{", ".join(nonsense_operator)}", ' \
                       f'inside "{self.rule}"!'
@@ -174,12 +236,11 @@ class ValidationRuleBase:
         self.nonsense_operators(self.rule.keys())
 
         # Operations that may be applied to str (not int).
-        valid_str_keys = [const.eq, const.ne, const.err]
         for k, v in self.rule.items():
-            if k not in valid_str_keys:
+            if k not in const.valid_str_keys:
                 err = f'The value of the rule "{self.name}", "{self.rule}", ' \
                       f'has encountered an invalid key "{k}". Valid keys: ' \
-                      f'{", ".join(valid_str_keys)}.'
+                      f'{const.valid_str_keys_str}.'
                 raise InvalidValueError(err)
 
     def validate_operators(self, d, valid_value_type):
@@ -301,18 +362,12 @@ class ValidationRuleBase:
         :param str prefix: str to prefix the return value (if any)
         :return: str
         """
-        sep = sep or const.trans_and
-        prefix = f'{prefix} ' if prefix else prefix
-        no_of_rules = len(rules)
-        if no_of_rules == 1:
+        if len(rules) == 1:
             return rules[0]
-        elif no_of_rules == 2:
-            human_rules = f' {sep} '.join(rules)
-        else:
-            joined = ', '.join(rules[:-1])
-            human_rules = f'{joined} {sep} {rules[-1]}'
-
-        return f'{prefix}{human_rules}'
+        sep = sep or const.trans_and
+        # With two rules, the comma-joined head is just the first rule.
+        human_rules = f'{", ".join(rules[:-1])} {sep} {rules[-1]}'
+        return f'{prefix} {human_rules}' if prefix else human_rules
 
     @staticmethod
     def render_human_rule(rule, safe=True):
@@ -355,22 +410,69 @@ class ValidationRuleBase:
         :param value: the value to be tested against the rule(s)
         :return: tuple (list, str)
         """
-        err = ''
-        tests = []
-        for str_opr, validator_value in rule.items():
-            if str_opr == const.err:
-                err = validator_value
-                continue
-            opr = const.comparison_operators[str_opr]
-            tests.append(opr(value, validator_value))
+        oprs, err = ValidationRuleBase.bind_operators(rule)
+        tests = [opr(value, validator_value) for opr, validator_value in oprs]
         return tests, err
 
+    @staticmethod
+    def bind_operators(rule):
+        """
+        Resolves the operators of the dict ``rule`` to their callables, once,
+        so that validators do not have to look them up on every upload.
+        Assumes that ``rule`` is a non-empty dict.
+
+        Example:
+
+        >>> import operator
+        >>> rule = {'gte': 100, 'lte': 500, 'err': 'custom error'}
+        >>> oprs = ((operator.ge, 100), (operator.le, 500))
+        >>> err = 'custom error'
+
+        :param dict rule: the rule(s) to bind
+        :return: tuple (tuple, str)
+        """
+        oprs = tuple(
+            (const.comparison_operators[str_opr], validator_value)
+            for str_opr, validator_value in rule.items()
+            if str_opr != const.err
+        )
+        return oprs, rule.get(const.err, '')
+
+    def validation_error(self, value, err=''):
+        """
+        Builds the error to be raised when the uploaded image does not meet
+        the validation rule.
+
+        The default error message is built once per language, with a
+        placeholder for the value, and reused by later failures.
+
+        :param value: the (prettified) value under test of the image
+        :param str err: the custom error message (if any)
+        :return: ``ValidationError`` instance
+        """
+        if not err:
+            language = get_language()
+            try:
+                template = self._error_templates[language]
+            except KeyError:
+                template = self.error_message_template(
+                    self.trans_name,
+                    '{value}',
+                    self.humanize_rule()
+                )
+                self._error_templates[language] = template
+            err = template.replace('{value}', str(value))
+        return ValidationError(self.render_human_rule(err))
+
 
 class ValidationRuleSize(ValidationRuleBase):
+    __slots__ = ('unit', )
+
     def __init__(self, name, rule):
         super().__init__(name, rule)
         self.unit = 'KB'
 
+    @cache_human_rule
     def humanize_rule(self):
         """
         Convert the rule into a more readable form (in order to render it
@@ -449,32 +551,46 @@ class ValidationRuleSize(ValidationRuleBase):
             self.valid_dict_rule()
 
     def generate_validator(self):
-        @const.docstring_parameter(rule_name=self.name, rule=self.rule)
+        docstring = const.docstring_parameter(
+            rule_name=self.name,
+            rule=self.rule
+        )
+        if isinstance(self.rule, int):
+            rule = self.rule
+
+            @docstring
+            def validator(value):
+                """{rule_name}: {rule}"""
+                value = value.size // 1024
+                if value != rule:
+                    raise self.validation_error(self.prettify_value(value))
+            return validator
+
+        # A rule not validated yet (of unknown type) has nothing to test.
+        oprs, err = (), ''
+        if isinstance(self.rule, dict):
+            oprs, err = self.bind_operators(self.rule)
+
+        @docstring
         def validator(value):
             """{rule_name}: {rule}"""
-            tests = []
-            err = ''
             value = value.size // 1024
-            if isinstance(self.rule, int):
-                tests.append(self.equal(value, self.rule))
-            elif isinstance(self.rule, dict):
-                tests, err = self.build_tests(self.rule, value)
-            if not all(tests):
-                err = err or self.error_message_template(
-                    self.trans_name,
-                    self.prettify_value(value),
-                    self.humanize_rule()
-                )
-                error = self.render_human_rule(err)
-                raise ValidationError(error)
+            for opr, validator_value in oprs:
+                if not opr(value, validator_value):
+                    raise self.validation_error(
+                        self.prettify_value(value), err
+                    )
         return validator
 
 
 class ValidationRuleDimensions(ValidationRuleBase):
+    __slots__ = ('unit', )
+
     def __init__(self, name, rule):
         super().__init__(name, rule)
         self.unit = 'px'
 
+    @cache_human_rule
     def humanize_rule(self):
         """
         Convert the rule into a more readable form (in order to render it
@@ -552,10 +668,9 @@ class ValidationRuleDimensions(ValidationRuleBase):
 
         :return: boolean
         """
-        set_keys = set(self.rule.keys())
-        if not set_keys:
-            return False
-        return set_keys.issubset(const.width_height_operators)
+        keys = self.rule.keys()
+        width_height_operators = const.width_height_operators
+        return bool(keys) and all(k in width_height_operators for k in keys)
 
     def valid_dict_rule(self):
         """
@@ -620,53 +735,85 @@ class ValidationRuleDimensions(ValidationRuleBase):
             self.valid_dict_rule()
 
     def generate_validator(self):
-        @const.docstring_parameter(rule_name=self.name, rule=self.rule)
+        docstring = const.docstring_parameter(
+            rule_name=self.name,
+            rule=self.rule
+        )
+        if isinstance(self.rule, tuple):
+            rule = self.rule
+
+            @docstring
+            def validation_results(value):
+                """{rule_name}: {rule}"""
+                dimensions = image_info(value)[0]
+                if dimensions != rule:
+                    raise self.validation_error(
+                        self.prettify_value(dimensions)
+                    )
+            return validation_results
+
+        if isinstance(self.rule, list):
+            try:
+                rules = frozenset(self.rule)
+            except TypeError:  # unhashable rule, i.e, not validated yet
+                rules = tuple(self.rule)
+
+            @docstring
+            def validation_results(value):
+                """{rule_name}: {rule}"""
+                dimensions = image_info(value)[0]
+                if dimensions not in rules:
+                    raise self.validation_error(
+                        self.prettify_value(dimensions)
+                    )
+            return validation_results
+
+        if isinstance(self.rule, dict) and self.has_width_height_keys():
+            # (operator, index of width or height, value) triples
+            oprs = []
+            errors = []
+            for dimension, opr_values in self.rule.items():
+                index = 0 if dimension == const.w else 1
+                dimension_oprs, e = self.bind_operators(opr_values)
+                oprs += [(opr, index, v) for opr, v in dimension_oprs]
+                if e:
+                    errors.append(e)
+            oprs = tuple(oprs)
+            err = ' '.join(errors)
+
+            @docstring
+            def validation_results(value):
+                """{rule_name}: {rule}"""
+                dimensions = image_info(value)[0]
+                for opr, index, validator_value in oprs:
+                    if not opr(dimensions[index], validator_value):
+                        raise self.validation_error(
+                            self.prettify_value(dimensions), err
+                        )
+            return validation_results
+
+        # A rule not validated yet (of unknown type) has nothing to test.
+        oprs, err = (), ''
+        if isinstance(self.rule, dict):
+            oprs, err = self.bind_operators(self.rule)
+
+        @docstring
         def validation_results(value):
             """{rule_name}: {rule}"""
-            tests = []
-            err = ''
-            test_condition = all
-            width, height = get_image_dimensions(value)
-            if isinstance(self.rule, tuple):
-                tests.append(self.equal(width, self.rule[0]))
-                tests.append(self.equal(height, self.rule[1]))
-            elif isinstance(self.rule, list):
-                test_condition = any
-                tests = [
-                    self.equal(width, dimensions[0]) and
-                    self.equal(height, dimensions[1])
-                    for dimensions in self.rule
-                ]
-            elif isinstance(self.rule, dict):
-                if self.has_width_height_keys():
-                    err = []
-                    for dimension, opr_values in self.rule.items():
-                        test_value = width if dimension == const.w else height
-                        loc_tests, e = self.build_tests(opr_values, test_value)
-                        tests += loc_tests
-                        if e:
-                            err.append(e)
-                    err = ' '.join(err)
-                else:
-                    for str_opr, validator_value in self.rule.items():
-                        if str_opr == const.err:
-                            err = validator_value
-                            continue
-                        opr = const.comparison_operators[str_opr]
-                        tests.append(opr(width, validator_value[0]))
-                        tests.append(opr(height, validator_value[1]))
-            if not test_condition(tests):
-                err = err or self.error_message_template(
-                    self.trans_name,
-                    self.prettify_value((width, height)),
-                    self.humanize_rule()
-                )
-                error = self.render_human_rule(err)
-                raise ValidationError(error)
+            width, height = dimensions = image_info(value)[0]
+            for opr, validator_value in oprs:
+                if not opr(width, validator_value[0]) \
+                        or not opr(height, validator_value[1]):
+                    raise self.validation_error(
+                        self.prettify_value(dimensions), err
+                    )
         return validation_results
 
 
 class ValidationRuleFormat(ValidationRuleBase):
+    __slots__ = ()
+
+    @cache_human_rule
     def humanize_rule(self):
         """
         Convert the rule into a more readable form (in order to render it
@@ -740,7 +887,8 @@ class ValidationRuleFormat(ValidationRuleBase):
         :return: boolean
         """
         if isinstance(format_str, str):
-            return format_str.lower() in const.allowable_web_image_extensions
+            return format_str.lower() in \
+                const.allowable_web_image_extensions_set
         return False
 
     def valid_format_list(self, list_formats):
@@ -752,7 +900,8 @@ class ValidationRuleFormat(ValidationRuleBase):
         :return: boolean
         """
         if list_formats:
-            return all([self.valid_format(ext) for ext in list_formats])
+            valid_format = self.valid_format
+            return all(valid_format(ext) for ext in list_formats)
         return False
 
     def valid_dict_rule(self):
@@ -775,12 +924,12 @@ class ValidationRuleFormat(ValidationRuleBase):
             if isinstance(v, str) and not self.valid_format(v):
                 err = f'The value of the key "{k}", inside "{self.name}: ' \
                       f'{self.rule}", should be one of: ' \
-                      f'"{", ".join(const.allowable_web_image_extensions)}".'
+                      f'"{const.allowable_web_image_extensions_str}".'
                 raise InvalidValueError(err)
             elif isinstance(v, list) and not self.valid_format_list(v):
                 err = f'The value of the key "{k}", inside "{self.name}: ' \
                       f'{self.rule}", should be one or more of: ' \
-                      f'"{", ".join(const.allowable_web_image_extensions)}".'
+                      f'"{const.allowable_web_image_extensions_str}".'
                 raise InvalidValueError(err)
 
     def is_valid(self):
@@ -811,14 +960,14 @@ class ValidationRuleFormat(ValidationRuleBase):
         if isinstance(self.rule, str) and not self.valid_format(self.rule):
             err = f'The value of the rule "{self.name}", "{self.rule}", ' \
                   f'should be one of the valid formats: ' \
-                  f'"{", ".join(const.allowable_web_image_extensions)}".'
+                  f'"{const.allowable_web_image_extensions_str}".'
             raise InvalidValueError(err)
 
         if isinstance(self.rule, list) and not \
                 self.valid_format_list(self.rule):
             err = f'The value of the rule "{self.name}", "{self.rule}", ' \
                   f'should be one or more of the valid image formats: ' \
-                  f'"{", ".join(const.allowable_web_image_extensions)}".'
+                  f'"{const.allowable_web_image_extensions_str}".'
             raise InvalidValueError(err)
 
         if isinstance(self.rule, dict):
@@ -829,50 +978,59 @@ class ValidationRuleFormat(ValidationRuleBase):
             self.valid_dict_rule()
 
     def generate_validator(self):
-        def __str_value(value, rule, opr):
-            return [(opr(value, rule))]
+        docstring = const.docstring_parameter(
+            rule_name=self.name,
+            rule=self.rule
+        )
 
-        def __list_value(value, rule, opr):
-            return [
-                opr(value, format_string)
-                for format_string in rule
-            ]
+        def lower_formats(formats):
+            if isinstance(formats, str):
+                formats = [formats]
+            return frozenset(format_str.lower() for format_str in formats)
 
-        @const.docstring_parameter(rule_name=self.name, rule=self.rule)
+        allowed = forbidden = None
+        err = ''
+        if isinstance(self.rule, (str, list)):
+            allowed = lower_formats(self.rule)
+        elif isinstance(self.rule, dict):
+            # Only one operator is allowed, "ne" or "eq".
+            err = self.rule.get(const.err, '')
+            for str_opr, formats in self.rule.items():
+                if str_opr == const.ne:
+                    forbidden = lower_formats(formats)
+                elif str_opr == const.eq:
+                    # An image has a single format, so it cannot be equal to
+                    # several different ones.
+                    formats = lower_formats(formats)
+                    allowed = formats if len(formats) == 1 else frozenset()
+
+        if allowed is not None:
+            @docstring
+            def validator(value):
+                """{rule_name}: {rule}"""
+                value = image_info(value)[1]
+                if value not in allowed:
+                    raise self.validation_error(
+                        self.prettify_value(value), err
+                    )
+            return validator
+
+        # A rule not validated yet (of unknown type) has nothing to test.
+        forbidden = forbidden or frozenset()
+
+        @docstring
         def validator(value):
             """{rule_name}: {rule}"""
-            tests = []
-            err = ''
-            test_condition = all
-            # By now, PIL.Image.verify() has run and "value" is a valid image.
-            value = Image.open(value).format.lower()
-            if isinstance(self.rule, str):
-                tests = __str_value(value, self.rule, self.equal)
-            elif isinstance(self.rule, list):
-                test_condition = any
-                tests = __list_value(value, self.rule, self.equal)
-            elif isinstance(self.rule, dict):
-                for str_opr, validator_value in self.rule.items():
-                    if str_opr == const.err:
-                        err = validator_value
-                        continue
-                    opr = const.comparison_operators[str_opr]
-                    if isinstance(validator_value, str):
-                        tests = __str_value(value, validator_value, opr)
-                    elif isinstance(validator_value, list):
-                        tests = __list_value(value, validator_value, opr)
-            if not test_condition(tests):
-                err = err or self.error_message_template(
-                    self.trans_name,
-                    self.prettify_value(value),
-                    self.humanize_rule()
-                )
-                error = self.render_human_rule(err)
-                raise ValidationError(error)
+            value = image_info(value)[1]
+            if value in forbidden:
+                raise self.validation_error(self.prettify_value(value), err)
         return validator
 
 
 class ValidationRuleAspectRatio(ValidationRuleBase):
+    __slots__ = ()
+
+    @cache_human_rule
     def humanize_rule(self):
         """
         Convert the rule into a more readable form (in order to render it
@@ -944,25 +1102,32 @@ class ValidationRuleAspectRatio(ValidationRuleBase):
             self.valid_dict_rule()
 
     def generate_validator(self):
-        @const.docstring_parameter(rule_name=self.name, rule=self.rule)
+        docstring = const.docstring_parameter(
+            rule_name=self.name,
+            rule=self.rule
+        )
+        if not isinstance(self.rule, dict):
+            rule = self.rule
+
+            @docstring
+            def validator(value):
+                """{rule_name}: {rule}"""
+                width, height = image_info(value)[0]
+                aspect_ratio = round(width / height, 2)
+                if aspect_ratio != rule:
+                    raise self.validation_error(aspect_ratio)
+            return validator
+
+        oprs, err = self.bind_operators(self.rule)
+
+        @docstring
         def validator(value):
             """{rule_name}: {rule}"""
-            tests = []
-            err = ''
-            width, height = get_image_dimensions(value)
+            width, height = image_info(value)[0]
             aspect_ratio = round(width / height, 2)
-            if isinstance(self.rule, float):
-                tests.append(self.equal(aspect_ratio, self.rule))
-            else:
-                tests, err = self.build_tests(self.rule, aspect_ratio)
-            if not all(tests):
-                err = err or self.error_message_template(
-                    self.trans_name,
-                    aspect_ratio,
-                    self.humanize_rule()
-                )
-                error = self.render_human_rule(err)
-                raise ValidationError(error)
+            for opr, validator_value in oprs:
+                if not opr(aspect_ratio, validator_value):
+                    raise self.validation_error(aspect_ratio, err)
         return validator
 
 
@@ -983,9 +1148,10 @@ def validation_rule_factory(key, value):
     :param dict value: a valid ``VIMAGE`` value
     :return: class instance
     """
-    cls = mapping.get(key, None)
-    if cls:
-        return cls(key, value)
-    err = f'[{key}]: This is not a valid key for a value. Valid values are ' \
-          f'"{", ".join(const.valid_types_strings)}"'
-    raise InvalidValueError(err)
+    try:
+        cls = mapping[key]
+    except KeyError:
+        err = f'[{key}]: This is not a valid key for a value. Valid values ' \
+              f'are "{const.valid_types_str}"'
+        raise InvalidValueError(err)
+    return cls(key, value)